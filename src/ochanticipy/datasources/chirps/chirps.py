@@ -141,18 +141,13 @@ class _Chirps(DataSource):
         filepath_list = self._get_to_be_processed_path_list()
 
         for filepath in filepath_list:
-            try:
-                ds = xr.open_dataset(filepath, decode_times=False)
-            except ValueError as err:
-                raise ValueError(
-                    f"The dataset {filepath} is not a valid netcdf file: "
-                    "something probbly went wrong during the download. "
-                    "Try downloading the file again."
-                ) from err
             processed_file_path = self._get_processed_path(filepath)
             processed_file_path.parent.mkdir(parents=True, exist_ok=True)
+            # the raw file is only opened if it needs to be processed
             last_filepath = self._process(
-                filepath=processed_file_path, ds=ds, clobber=clobber
+                filepath=processed_file_path,
+                raw_filepath=filepath,
+                clobber=clobber,
             )
 
         return last_filepath.parents[0]
@@ -181,9 +176,8 @@ class _Chirps(DataSource):
             )
 
         try:
-            ds = xr.open_mfdataset(
-                filepath_list,
-            )
+            # setting the engine skips guessing it from each file
+            ds = xr.open_mfdataset(filepath_list, engine="netcdf4")
             # include the names of all files that are included in the ds
             ds.attrs["included_files"] = [f.stem for f in filepath_list]
         except FileNotFoundError as err:
@@ -275,7 +269,7 @@ class _Chirps(DataSource):
         )
 
     def _get_processed_path(self, raw_path: Path) -> Path:
-        return self._processed_base_dir / raw_path.parts[-1]
+        return self._processed_base_dir / raw_path.name
 
     def _get_location_url(self):
         location_url = (
@@ -314,12 +308,9 @@ class _Chirps(DataSource):
         date_list = self._create_date_list()
 
         filepath_list = [
-            self._get_processed_path(
-                self._get_raw_path(
-                    year=f"{d.year}",
-                    month=f"{d.month:02d}",
-                    day=f"{d.day:02d}",
-                )
+            self._processed_base_dir
+            / self._get_file_name(
+                year=f"{d.year}", month=f"{d.month:02d}", day=f"{d.day:02d}"
             )
             for d in date_list
         ]
@@ -345,8 +336,23 @@ class _Chirps(DataSource):
             out_file.write(response.content)
         return filepath
 
+    @staticmethod
+    def _load_raw(raw_filepath: Path) -> xr.Dataset:
+        try:
+            return xr.open_dataset(
+                raw_filepath, engine="netcdf4", decode_times=False
+            )
+        except ValueError as err:
+            raise ValueError(
+                f"The dataset {raw_filepath} is not a valid netcdf file: "
+                "something probbly went wrong during the download. "
+                "Try downloading the file again."
+            ) from err
+
     @check_file_existence
-    def _process(self, filepath: Path, ds, clobber: bool) -> Path:
+    def _process(
+        self, filepath: Path, raw_filepath: Path, clobber: bool
+    ) -> Path:
         pass
 
 
@@ -469,7 +475,10 @@ class ChirpsMonthly(_Chirps):
         return url
 
     @check_file_existence
-    def _process(self, filepath: Path, ds, clobber: bool) -> Path:
+    def _process(
+        self, filepath: Path, raw_filepath: Path, clobber: bool
+    ) -> Path:
+        ds = self._load_raw(raw_filepath)
         # fix dates
         ds.oap.correct_calendar(inplace=True)
         ds = xr.decode_cf(ds)
@@ -603,7 +612,10 @@ class ChirpsDaily(_Chirps):
         return url
 
     @check_file_existence
-    def _process(self, filepath: Path, ds, clobber: bool) -> Path:
+    def _process(
+        self, filepath: Path, raw_filepath: Path, clobber: bool
+    ) -> Path:
+        ds = self._load_raw(raw_filepath)
         # fix dates
         ds = ds.assign_coords(
             T=cftime.datetime.fromordinal(
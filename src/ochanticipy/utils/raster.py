@@ -21,14 +21,17 @@ can be inherited by the two respective extensions.
 """
 
 import logging
+from dataclasses import dataclass, replace
 from typing import Any, Dict, List, Optional, Union
 
+import dask
 import geopandas as gpd
 import numpy as np
 import pandas as pd
 import rioxarray  # noqa: F401
 import xarray as xr
-from rioxarray.exceptions import DimensionError, MissingCRS, NoDataInBounds
+from rasterio.features import geometry_mask
+from rioxarray.exceptions import DimensionError, MissingCRS
 from rioxarray.raster_array import RasterArray
 from rioxarray.raster_dataset import RasterDataset
 from rioxarray.rioxarray import CRS, _get_data_var_message
@@ -36,6 +39,18 @@ from rioxarray.rioxarray import CRS, _get_data_var_message
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class _OapState:
+    """Dimension state of the ``oap`` accessor.
+
+    Frozen so that copies of an object can share the same
+    state, which is replaced rather than modified on updates.
+    """
+
+    t_dim: Optional[str] = None
+    longitude_range: Optional[str] = None
+
+
 class OapRasterMixin:
     """OCHA AnticiPy mixin base class."""
 
@@ -63,26 +78,35 @@ class OapRasterMixin:
             self._y_dim = self._obj.rio._y_dim = "Y"
 
         # Managing time coordinate default dims
-        self._t_dim = None
+        t_dim = None
         for t in ["t", "T", "time"]:
             if t in self._obj.dims:
-                self._t_dim = t
+                t_dim = t
 
-        # longitude range indicates if coordinates are
-        # between -180 and 180 or 0 and 360
-        self._longitude_range = None
+        # longitude range, which indicates if coordinates are
+        # between -180 and 180 or 0 and 360, is set on first use
+        self._state = _OapState(t_dim=t_dim)
 
     # methods derived from rioxarray.rioxarray.x_dim and y_dim
     @property
     def t_dim(self):
         """str: The dimension for time."""
-        if self._t_dim is None:
+        if self._state.t_dim is None:
             raise DimensionError(
                 "Time dimension not found. 'oap.set_time_dim()' or "
                 "using 'rename()' to change the dimension name to "
                 f"'t' can address this.{_get_data_var_message(self._obj)}"
             )
-        return self._t_dim
+        return self._state.t_dim
+
+    @property
+    def crs(self) -> Optional[CRS]:
+        """:obj:`rasterio.crs.CRS`: The projection of the object.
+
+        ``rioxarray`` stores the CRS it parses on the ``rio`` accessor,
+        so it is retrieved and cached there.
+        """
+        return self._obj.rio.crs
 
     @property
     def longitude_range(self):
@@ -92,21 +116,21 @@ class OapRasterMixin:
         between -180 and 180 (indicated by '180')
         or 0 and 360 (indicated by '360').
         """
-        if self._longitude_range is None:
+        if self._state.longitude_range is None:
             if self._x_dim is not None:
                 data_obj = self._get_obj_oap(inplace=False)
                 lon_max = data_obj.indexes[self.x_dim].max()
-                if lon_max > 180:
-                    self._longitude_range = "360"
-                else:
-                    self._longitude_range = "180"
+                self._state = replace(
+                    self._state,
+                    longitude_range="360" if lon_max > 180 else "180",
+                )
             else:
                 raise DimensionError(
                     "Longitude range not set due to missing 'x_dim'."
                     "Use 'oap.set_spatial_dims()' to set the name of "
                     f"the x dimension. {_get_data_var_message(self._obj)}"
                 )
-        return self._longitude_range
+        return self._state.longitude_range
 
     def set_time_dim(
         self, t_dim: str, inplace: bool = False
@@ -146,7 +170,7 @@ class OapRasterMixin:
                 "Time dimension ({t_dim}) not found."
                 f"{_get_data_var_message(data_obj)}"
             )
-        data_obj.oap._t_dim = t_dim
+        data_obj.oap._state = replace(data_obj.oap._state, t_dim=t_dim)
         return data_obj if not inplace else None
 
     def correct_calendar(
@@ -195,7 +219,9 @@ class OapRasterMixin:
         >>> da_crct["t"].attrs["calendar"]
         '360_day'
         """
-        data_obj = self._get_obj_oap(inplace=inplace)
+        # a shallow copy still gets its own attribute dictionaries,
+        # so the data itself does not need to be copied
+        data_obj = self._get_obj_oap(inplace=inplace, deep=False)
         if (
             "calendar" in data_obj[self.t_dim].attrs.keys()
             and data_obj[self.t_dim].attrs["calendar"] == "360"
@@ -360,20 +386,26 @@ class OapRasterMixin:
             data_obj[self.x_dim] = np.sort(
                 ((data_obj[self.x_dim] + 180) % 360) - 180
             )
-            data_obj.oap._longitude_range = "180"
+            data_obj.oap._state = replace(
+                data_obj.oap._state, longitude_range="180"
+            )
 
         elif not to_180_range and self.longitude_range == "180":
             logger.info("Converting longitude from -180 to 180 to 0 to 360.")
 
             data_obj[self.x_dim] = np.sort(data_obj[self.x_dim] % 360)
-            data_obj.oap._longitude_range = "360"
+            data_obj.oap._state = replace(
+                data_obj.oap._state, longitude_range="360"
+            )
 
         else:
             logger.info("Coordinates already in required range.")
 
         return data_obj if not inplace else None
 
-    def _get_obj_oap(self, inplace: bool) -> Union[xr.DataArray, xr.Dataset]:
+    def _get_obj_oap(
+        self, inplace: bool, deep: bool = True
+    ) -> Union[xr.DataArray, xr.Dataset]:
         """
         Get object to modify.
 
@@ -386,6 +418,10 @@ class OapRasterMixin:
         ----------
         inplace : bool
             If True, returns self
+        deep : bool, optional
+            If False, the copy shares its data with the original
+            object, which is enough when only attributes are
+            modified. By default True.
 
         Returns
         -------
@@ -395,16 +431,15 @@ class OapRasterMixin:
         if inplace:
             return self._obj
 
-        obj_copy = self._obj.copy(deep=True)
+        obj_copy = self._obj.copy(deep=deep)
 
         # preserve attribute information
         obj_copy.rio._x_dim = self._x_dim
         obj_copy.rio._y_dim = self._y_dim
         obj_copy.rio._width = self._width
         obj_copy.rio._height = self._height
-        obj_copy.rio._crs = self._crs
-        obj_copy.oap._t_dim = self._t_dim
-        obj_copy.oap._longitude_range = self._longitude_range
+        obj_copy.rio._crs = self._obj.rio._crs
+        obj_copy.oap._state = self._state
 
         return obj_copy
 
@@ -423,6 +458,7 @@ class OapRasterArray(OapRasterMixin, RasterArray):
         stats_list: Optional[List[str]] = None,
         percentile_list: Optional[List[int]] = None,
         all_touched: bool = False,
+        use_dask: Optional[bool] = None,
     ) -> pd.DataFrame:
         """Compute raster statistics for polygon geometry.
 
@@ -448,6 +484,14 @@ class OapRasterArray(OapRasterMixin, RasterArray):
             included, by default False. If ``False``, only
             cells with their centre in the region will be
             included.
+        use_dask : Optional[bool], optional
+            If ``True``, statistics for all features are evaluated
+            lazily and computed together in a single pass with
+            ``dask``, which allows features to be processed in
+            parallel and chunks to be read only once. By default
+            None, in which case ``dask`` is used if the array is
+            dask-backed. Note that computing percentiles requires
+            the spatial dimensions to be in a single chunk.
 
         Returns
         -------
@@ -485,34 +529,67 @@ class OapRasterArray(OapRasterMixin, RasterArray):
         0       3.0  1.5811388300841898        1        5     12.0          4  area_a  # noqa: E501
         1       4.5                 1.5        3        6      9.0          2  area_b  # noqa: E501
         """
-        if self._obj.rio.crs is None:
+        # the CRS is resolved lazily and cached, so it is passed on
+        # to copies without re-parsing
+        if self.crs is None:
             raise MissingCRS("No CRS found, set CRS before computation.")
 
         data_obj = self._get_obj_oap(inplace=False)
-        df_list = []
+        feature_list = []
+        grid_stats_list = []
 
         if stats_list is None:
             stats_list = ["mean", "std", "min", "max", "sum", "count"]
 
-        for feature in gdf[feature_col].unique():
-            gdf_adm = gdf[gdf[feature_col] == feature]
-
-            da_clip = data_obj.rio.set_spatial_dims(
-                x_dim=self.x_dim, y_dim=self.y_dim
+        if use_dask is None:
+            use_dask = self._obj.chunks is not None
+
+        data_obj.rio.set_spatial_dims(
+            x_dim=self.x_dim, y_dim=self.y_dim, inplace=True
+        )
+
+        # geometries are masked the same way as ``rio.clip()``, but
+        # the transform, shape and nodata are only determined once
+        transform = data_obj.rio.transform(recalc=True)
+        out_shape = (data_obj.rio.height, data_obj.rio.width)
+        nodata = data_obj.rio.nodata
+
+        # groupby hashes the feature column once rather than
+        # masking the whole frame for every feature
+        for feature, gdf_adm in gdf.groupby(feature_col, sort=False):
+            clip_mask = geometry_mask(
+                gdf_adm.geometry,
+                out_shape=out_shape,
+                transform=transform,
+                invert=True,
+                all_touched=all_touched,
             )
+            rows = np.flatnonzero(clip_mask.any(axis=1))
+            cols = np.flatnonzero(clip_mask.any(axis=0))
 
-            # clip returns error if no overlapping raster cells for geometry
-            # so catching and skipping rest of iteration so no stats computed
-            try:
-                da_clip = da_clip.rio.clip(
-                    gdf_adm.geometry, all_touched=all_touched
-                )
-            except NoDataInBounds:
+            # skipping rest of iteration if no overlapping raster cells
+            # for geometry so no stats computed
+            if rows.size == 0:
                 logger.warning(
                     "No overlapping raster cells for %s, skipping.", feature
                 )
                 continue
 
+            # crop to the extent of the geometry before masking
+            y_slice = slice(rows[0], rows[-1] + 1)
+            x_slice = slice(cols[0], cols[-1] + 1)
+            da_clip = data_obj.isel(
+                {self.y_dim: y_slice, self.x_dim: x_slice}
+            ).where(
+                xr.DataArray(
+                    clip_mask[y_slice, x_slice],
+                    dims=(self.y_dim, self.x_dim),
+                )
+            )
+            if nodata is not None and not np.isnan(nodata):
+                da_clip = da_clip.fillna(nodata)
+            da_clip = da_clip.astype(data_obj.dtype)
+
             grid_stat_all = []
             for stat in stats_list:
                 # count automatically ignores NaNs
@@ -531,32 +608,55 @@ class OapRasterArray(OapRasterMixin, RasterArray):
                 grid_stat_all.append(grid_stat)
 
             if percentile_list is not None:
-                grid_quant = [
-                    da_clip.quantile(quant / 100, dim=[self.x_dim, self.y_dim])
-                    .drop_vars("quantile")
-                    .rename(f"{quant}quant")
-                    for quant in percentile_list
-                ]
-                grid_stat_all.extend(grid_quant)
-
-            # if dims is 0, it throws an error when merging
-            # and then converting to a df
-            # this occurs when the input da is 2D
-            if not grid_stat_all[0].dims:
-                df_adm = pd.DataFrame(
-                    {
-                        da_stat.name: [da_stat.values]
-                        for da_stat in grid_stat_all
-                    }
+                # all percentiles computed in a single call so the
+                # clipped data is only sorted once, then split into
+                # named variables by labelling the quantile dimension
+                ds_quant = (
+                    da_clip.quantile(
+                        [quant / 100 for quant in percentile_list],
+                        dim=[self.x_dim, self.y_dim],
+                    )
+                    .assign_coords(
+                        quantile=[f"{quant}quant" for quant in percentile_list]
+                    )
+                    .to_dataset(dim="quantile")
                 )
+                grid_stat_all.extend(ds_quant.data_vars.values())
 
-            else:
-                zonal_stats_xr = xr.merge(grid_stat_all)
-                df_adm = (
-                    zonal_stats_xr.to_dataframe()
-                    .drop("spatial_ref", axis=1)
-                    .reset_index()
-                )
+            feature_list.append(feature)
+            grid_stats_list.append(grid_stat_all)
+
+        # with dask, reductions so far are lazy and are computed for
+        # all features at once so they can share chunk reads
+        if use_dask:
+            grid_stats_list = dask.compute(
+                *grid_stats_list, scheduler="threads"
+            )
+
+        # if dims is 0, it throws an error when merging
+        # and then converting to a df
+        # this occurs when the input da is 2D, so each feature
+        # is a single row that is filled into preallocated arrays
+        if grid_stats_list and not grid_stats_list[0][0].dims:
+            stats_out = {
+                da_stat.name: np.empty(len(feature_list), dtype=da_stat.dtype)
+                for da_stat in grid_stats_list[0]
+            }
+            for i, grid_stat_all in enumerate(grid_stats_list):
+                for da_stat in grid_stat_all:
+                    stats_out[da_stat.name][i] = da_stat.values
+            return pd.DataFrame({**stats_out, feature_col: feature_list})
+
+        df_list = []
+        for feature, grid_stat_all in zip(feature_list, grid_stats_list):
+            zonal_stats_xr = xr.merge(grid_stat_all)
+            # the CRS coordinate is only present if it was written to
+            # the array, not when it was only set with ``rio.set_crs()``
+            df_adm = (
+                zonal_stats_xr.drop_vars("spatial_ref", errors="ignore")
+                .to_dataframe()
+                .reset_index()
+            )
             df_adm[feature_col] = feature
             df_list.append(df_adm)
 
@@ -631,12 +731,13 @@ class OapRasterDataset(OapRasterMixin, RasterDataset):
                 x_dim=self._x_dim, y_dim=self._y_dim, inplace=True
             )
 
-        if self.crs is not None:
-            obj.rio.set_crs(self._crs, inplace=True)
+        crs = self.crs
+        if crs is not None:
+            obj.rio.set_crs(crs, inplace=True)
 
         # raster module attributes
-        if self._t_dim is not None:
-            obj.oap.set_time_dim(self._t_dim, inplace=True)
+        if self._state.t_dim is not None:
+            obj.oap.set_time_dim(self._state.t_dim, inplace=True)
 
         return obj
 
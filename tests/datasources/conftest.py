@@ -5,16 +5,21 @@ from ochanticipy import GeoBoundingBox, create_custom_country_config
 from ochanticipy.config.pathconfig import BASE_DIR_ENV
 
 CONFIG_FILE = "tests/datasources/fake_config.yaml"
+MULTI_RESOURCE_CONFIG = "tests/datasources/fake_codab_multi.yaml"
 ISO3 = "abc"
 ISO2 = "ab"
 
 
 @pytest.fixture(autouse=True)
 def mock_aa_data_dir(tmp_path_factory, mocker):
-    """Mock out the base directory environment variable."""
-    mock_aa_data_dir_path = tmp_path_factory.mktemp(
-        basename="test_aa_data_dir"
-    )
+    """
+    Mock out the base directory environment variable.
+
+    Many tests write to the data directory, so each test gets its own
+    empty directory from ``tmp_path_factory``, which also keeps the
+    directories of parallel test workers apart.
+    """
+    mock_aa_data_dir_path = tmp_path_factory.mktemp(basename="aa_data")
     mocker.patch.dict(
         "ochanticipy.config.pathconfig.os.environ",
         {BASE_DIR_ENV: str(mock_aa_data_dir_path)},
@@ -22,13 +27,36 @@ def mock_aa_data_dir(tmp_path_factory, mocker):
     return mock_aa_data_dir_path
 
 
-@pytest.fixture
-def mock_country_config():
-    """Fixture for pipeline with test config params."""
+@pytest.fixture(scope="session")
+def session_country_config():
+    """Parse the test config once per session."""
     return create_custom_country_config(filepath=CONFIG_FILE)
 
 
 @pytest.fixture
+def mock_country_config(session_country_config):
+    """
+    Fixture for pipeline with test config params.
+
+    Some tests modify the config, so each test gets its own
+    copy of the config parsed once per session.
+    """
+    return session_country_config.copy(deep=True)
+
+
+@pytest.fixture(scope="session")
+def mock_config_multi():
+    """Fixture for CODAB with multiple resources."""
+    return create_custom_country_config(filepath=MULTI_RESOURCE_CONFIG)
+
+
+@pytest.fixture(scope="session")
+def iridl_geo_bounding_box():
+    """Input GeoBoundingBox for the datasources served by IRIDL."""
+    return GeoBoundingBox(lat_max=6, lat_min=3.2, lon_max=2, lon_min=-3)
+
+
+@pytest.fixture(scope="session")
 def geo_bounding_box():
     """Input GeoBoundingBox to use."""
     gbb = GeoBoundingBox(lat_max=1.0, lat_min=-2.2, lon_max=3.3, lon_min=-4.4)
@@ -38,9 +66,5 @@ def geo_bounding_box():
 def pytest_configure(config):
     """Create custom markers to add to tests."""
     config.addinivalue_line(
-        "markers",
-        (
-            "nomockiso2: do not mock the get_iso2_from_iso3 function. "
-            "Used for FEWS NET"
-        ),
+        "markers", "chirps: tests of the CHIRPS datasource"
     )
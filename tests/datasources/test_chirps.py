@@ -1,15 +1,19 @@
 """Tests for the Chirps module."""
-import calendar
+import functools
 from datetime import date
-from pathlib import Path
+from pathlib import PurePosixPath
 
 import cftime
 import numpy as np
 import pytest
 import xarray as xr
+from conftest import ISO3
 from xarray.coding.cftimeindex import CFTimeIndex
 
-from ochanticipy import ChirpsDaily, ChirpsMonthly, GeoBoundingBox
+from ochanticipy import ChirpsDaily, ChirpsMonthly
+from ochanticipy.datasources.chirps import chirps as chirps_module
+
+pytestmark = pytest.mark.chirps
 
 DATASOURCE_BASE_DIR = "chirps"
 
@@ -29,48 +33,119 @@ END_MONTH = "08"
 END_MONTH_NAME = "Aug"
 END_DAY = "01"
 
+IRIDL_MONTHLY_BASE = (
+    "https://iridl.ldeo.columbia.edu/SOURCES/.UCSB/"
+    ".CHIRPS/.v2p0/.monthly/.global/.precipitation/"
+    "X/%28-3.0%29%282.0%29RANGEEDGES/"
+    "Y/%286.0%29%283.2%29RANGEEDGES/"
+)
+IRIDL_DAILY_BASE = (
+    "https://iridl.ldeo.columbia.edu/SOURCES/.UCSB/"
+    ".CHIRPS/.v2p0/.daily-improved/.global/.0p05/.prcp/"
+    "X/%28-3.0%29%282.0%29RANGEEDGES/"
+    "Y/%286.0%29%283.2%29RANGEEDGES/"
+)
+
+# each URL requests a time range that starts and ends on the same date
+T_RANGE_URL_TEMPLATE = "T/%28{t}%29%28{t}%29RANGEEDGES/data.nc"
+
+MONTHLY_URLS = tuple(
+    IRIDL_MONTHLY_BASE
+    + T_RANGE_URL_TEMPLATE.format(t=f"{month_name}%20{START_YEAR}")
+    for month_name in (START_MONTH_NAME, END_MONTH_NAME)
+)
+
+DAILY_URLS = tuple(
+    IRIDL_DAILY_BASE
+    + T_RANGE_URL_TEMPLATE.format(t=f"{day}%20{month_name}%20{START_YEAR}")
+    for day, month_name in [
+        (f"{day:02d}", START_MONTH_NAME) for day in range(int(START_DAY), 32)
+    ]
+    + [(END_DAY, END_MONTH_NAME)]
+)
 
-@pytest.fixture
-def mock_chirps(mocker, mock_country_config):
-    """Create Chirps class with mock country config."""
-    geo_bounding_box = GeoBoundingBox(
-        lat_max=6, lat_min=3.2, lon_max=2, lon_min=-3
-    )
+# read-only, since it is shared by the raw datasets and the checks
+PRCP_VALUES = np.arange(8).reshape(2, 2, 2)
+PRCP_VALUES.setflags(write=False)
 
-    mocker.patch(
-        (
-            "ochanticipy.datasources.chirps.chirps.ChirpsDaily"
-            "._get_last_available_date"
-        ),
-        return_value=CURRENT_DATE,
-    )
+EXPECTED_MONTHLY_T_INDEX = CFTimeIndex(
+    [
+        cftime.Datetime360Day(year=2017, month=2, day=16),
+        cftime.Datetime360Day(year=2017, month=3, day=16),
+    ]
+)
 
-    mocker.patch(
-        (
-            "ochanticipy.datasources.chirps.chirps.ChirpsMonthly"
-            "._get_last_available_date"
-        ),
-        return_value=CURRENT_DATE,
-    )
+EXPECTED_DAILY_T_INDEX = CFTimeIndex(
+    [
+        cftime.DatetimeGregorian(year=2007, month=10, day=23, hour=12),
+        cftime.DatetimeGregorian(year=2007, month=10, day=24, hour=12),
+    ]
+)
+
+MONTHLY_DATES = (START_DATE, END_DATE)
+
+DAILY_DATES = tuple(
+    date(year=2020, month=7, day=day) for day in range(int(START_DAY), 32)
+) + (END_DATE,)
+
+RAW_PREFIX = PurePosixPath(f"public/raw/{ISO3}/{DATASOURCE_BASE_DIR}")
+PROCESSED_PREFIX = PurePosixPath(
+    f"public/processed/{ISO3}/{DATASOURCE_BASE_DIR}"
+)
+
+MONTHLY_FILENAME_LIST = [
+    f"{ISO3}_chirps_monthly_{START_YEAR}_{month:02d}_r0.05_Np6Sp3Ep2Wm3.nc"
+    for month in range(int(START_MONTH), int(END_MONTH) + 1)
+]
+
+DAILY_FILENAME_LIST = [
+    f"{ISO3}_chirps_daily_{START_YEAR}_{START_MONTH}_{day}_"
+    "r0.05_Np6Sp3Ep2Wm3.nc"
+    for day in range(int(START_DAY), 32)
+] + [
+    f"{ISO3}_chirps_daily_{END_YEAR}_{END_MONTH}_{END_DAY}_"
+    "r0.05_Np6Sp3Ep2Wm3.nc"
+]
+
+
+@pytest.fixture(scope="module", autouse=True)
+def mock_last_available_date(module_mocker):
+    """Mock the last available date for all tests in the module."""
+    for chirps_class in (ChirpsDaily, ChirpsMonthly):
+        module_mocker.patch.object(
+            chirps_class,
+            "_get_last_available_date",
+            return_value=CURRENT_DATE,
+        )
 
+
+@pytest.fixture
+def mock_chirps(session_country_config, iridl_geo_bounding_box):
+    """
+    Create Chirps class with mock country config.
+
+    Chirps only reads the config, so the session copy is shared.
+    Instances are cached within a test only, since their paths
+    depend on the data directory of the test.
+    """
+
+    @functools.lru_cache(maxsize=None)
     def _mock_chirps(
         frequency: str = "daily",
-        resolution: float = 0.05,
         start_date: date = START_DATE,
         end_date: date = END_DATE,
     ):
         if frequency == "daily":
             chirps = ChirpsDaily(
-                country_config=mock_country_config,
-                geo_bounding_box=geo_bounding_box,
-                resolution=resolution,
+                country_config=session_country_config,
+                geo_bounding_box=iridl_geo_bounding_box,
                 start_date=start_date,
                 end_date=end_date,
             )
         else:
             chirps = ChirpsMonthly(
-                country_config=mock_country_config,
-                geo_bounding_box=geo_bounding_box,
+                country_config=session_country_config,
+                geo_bounding_box=iridl_geo_bounding_box,
                 start_date=start_date,
                 end_date=end_date,
             )
@@ -79,30 +154,68 @@ def mock_chirps(mocker, mock_country_config):
     return _mock_chirps
 
 
+def _fake_prcp_dataset(t: list, calendar: str, units: str) -> xr.Dataset:
+    ds = xr.Dataset(
+        data_vars={"prcp": (("X", "Y", "T"), PRCP_VALUES)},
+        coords={
+            "X": [1, 2],
+            "Y": [2, -3],
+            "T": t,
+        },
+    )
+
+    ds["T"].attrs["calendar"] = calendar
+    ds["T"].attrs["units"] = units
+    return ds
+
+
+# processing returns new objects rather than modifying the raw
+# dataset, so it can be built once and shared across the module
+@pytest.fixture(scope="module")
+def fake_monthly_prcp_dataset():
+    """Create raw monthly dataset as downloaded from IRI."""
+    return _fake_prcp_dataset(
+        t=[685.5, 686.5], calendar="360", units="months since 1960-01-01"
+    )
+
+
+@pytest.fixture(scope="module")
+def fake_daily_prcp_dataset():
+    """Create raw daily dataset as downloaded from IRI."""
+    return _fake_prcp_dataset(
+        t=[2454397.0, 2454398.0], calendar="standard", units="julian_day"
+    )
+
+
 @pytest.fixture
 def mock_xr_open_multiple_dataset(mocker):
     """Mock GeoPandas file reading function."""
-    ds = xr.Dataset()
-    return mocker.patch(
-        "ochanticipy.datasources.chirps.chirps.xr.open_mfdataset",
-        return_value=ds,
+    return mocker.patch.object(
+        chirps_module.xr,
+        "open_mfdataset",
+        side_effect=lambda *args, **kwargs: xr.Dataset(),
     )
 
 
 @pytest.fixture
 def mock_dataset_to_netcdf(mocker):
     """Mock GeoPandas file writing function."""
-    return mocker.patch(
-        "ochanticipy.datasources.chirps.chirps.xr.Dataset.to_netcdf",
+    return mocker.patch.object(chirps_module.xr.Dataset, "to_netcdf")
+
+
+def _urls_and_paths(download_mock):
+    """Get the URLs and filepaths passed to the mocked download."""
+    call_args_list = download_mock.call_args_list
+    return (
+        [call.kwargs["url"] for call in call_args_list],
+        [call.kwargs["filepath"] for call in call_args_list],
     )
 
 
 @pytest.fixture
 def mock_download(mocker, mock_chirps):
     """Create mock for download method."""
-    download_mock = mocker.patch(
-        "ochanticipy.datasources.chirps.chirps._Chirps._download"
-    )
+    download_mock = mocker.patch.object(chirps_module._Chirps, "_download")
 
     def _mock_download(
         frequency: str,
@@ -113,184 +226,132 @@ def mock_download(mocker, mock_chirps):
             end_date=END_DATE,
         )
         chirps.download()
-        args_download = download_mock.call_args_list
-        url_list = [k["url"] for (_, k) in args_download]
-        filepath_list = [k["filepath"] for (_, k) in args_download]
-        return url_list, filepath_list
+        return _urls_and_paths(download_mock)
 
     return _mock_download
 
 
-def test_valid_arguments_class(mocker, mock_country_config):
-    """Test for resolution and wrong dates in initialisation class."""
-    mocker.patch(
-        (
-            "ochanticipy.datasources.chirps.chirps.ChirpsDaily"
-            "._get_last_available_date"
-        ),
-        return_value=CURRENT_DATE,
-    )
-
-    geo_bounding_box = GeoBoundingBox(
-        lat_max=6, lat_min=3.2, lon_max=2, lon_min=-3
-    )
+def test_invalid_resolution(session_country_config, iridl_geo_bounding_box):
+    """Test that only the available resolutions are accepted."""
     with pytest.raises(ValueError):
         ChirpsDaily(
-            country_config=mock_country_config,
-            geo_bounding_box=geo_bounding_box,
-            resolution=0.10,
-            start_date=START_DATE,
-            end_date=END_DATE,
-        )
-        ChirpsDaily(
-            country_config=mock_country_config,
-            geo_bounding_box=geo_bounding_box,
+            country_config=session_country_config,
+            geo_bounding_box=iridl_geo_bounding_box,
             resolution=0.10,
             start_date=START_DATE,
-            end_date=FUTURE_DATE,
-        )
-        ChirpsDaily(
-            country_config=mock_country_config,
-            geo_bounding_box=geo_bounding_box,
-            resolution=0.10,
-            start_date=PAST_DATE,
             end_date=END_DATE,
         )
 
 
-def test_download_monthly(
-    mock_aa_data_dir, mock_country_config, mock_download
-):
-    """Test of call download for monthly data."""
-    url_list, filepath_list = mock_download(frequency="monthly")
-
-    url_list_control = [
-        (
-            "https://iridl.ldeo.columbia.edu/SOURCES/.UCSB/"
-            ".CHIRPS/.v2p0/.monthly/.global/.precipitation/"
-            f"X/%28-3.0%29%282.0%29RANGEEDGES/"
-            f"Y/%286.0%29%283.2%29RANGEEDGES/"
-            f"T/%28{MONTH_NAME}%20{START_YEAR}%29"
-            f"%28{MONTH_NAME}%20{START_YEAR}"
-            "%29RANGEEDGES/data.nc"
+@pytest.mark.parametrize(
+    "frequency, start_date, end_date",
+    [
+        ("daily", START_DATE, FUTURE_DATE),
+        ("monthly", START_DATE, FUTURE_DATE),
+        ("daily", PAST_DATE, END_DATE),
+        ("monthly", PAST_DATE, END_DATE),
+    ],
+)
+def test_valid_arguments_class(mock_chirps, frequency, start_date, end_date):
+    """Test for wrong dates in initialisation class."""
+    with pytest.raises(ValueError):
+        mock_chirps(
+            frequency=frequency,
+            start_date=start_date,
+            end_date=end_date,
         )
-        for MONTH_NAME in [
-            calendar.month_abbr[month]
-            for month in range(int(START_MONTH), int(END_MONTH) + 1)
-        ]
-    ]
 
-    filepath_list_control = [
-        mock_aa_data_dir
-        / (
-            f"public/raw/{mock_country_config.iso3}/{DATASOURCE_BASE_DIR}/"
-            f"abc_chirps_monthly_{START_YEAR}_{MONTH:02d}_"
-            "r0.05_Np6Sp3Ep2Wm3.nc"
-        )
-        for MONTH in range(int(START_MONTH), int(END_MONTH) + 1)
-    ]
 
-    assert url_list == url_list_control
-    assert filepath_list == filepath_list_control
-
-
-def test_download_daily(mock_aa_data_dir, mock_country_config, mock_download):
-    """Test of call download for daily data."""
-    url_list, filepath_list = mock_download(frequency="daily")
-
-    url_list_control = [
-        (
-            "https://iridl.ldeo.columbia.edu/SOURCES/.UCSB/"
-            ".CHIRPS/.v2p0/.daily-improved/.global/.0p05/.prcp/"
-            f"X/%28-3.0%29%282.0%29RANGEEDGES/"
-            f"Y/%286.0%29%283.2%29RANGEEDGES/"
-            f"T/%28{DAY:02d}%20{START_MONTH_NAME}%20{START_YEAR}"
-            f"%29%28{DAY:02d}%20{START_MONTH_NAME}%20{START_YEAR}"
-            "%29RANGEEDGES/data.nc"
-        )
-        for DAY in range(int(START_DAY), 32)
-    ]
-
-    url_list_control.append(
-        "https://iridl.ldeo.columbia.edu/SOURCES/.UCSB/"
-        ".CHIRPS/.v2p0/.daily-improved/.global/.0p05/.prcp/"
-        f"X/%28-3.0%29%282.0%29RANGEEDGES/"
-        f"Y/%286.0%29%283.2%29RANGEEDGES/"
-        f"T/%2801%20{END_MONTH_NAME}%20{START_YEAR}"
-        f"%29%2801%20{END_MONTH_NAME}%20{START_YEAR}"
-        "%29RANGEEDGES/data.nc"
-    )
+@pytest.mark.parametrize(
+    "frequency, date_list_control",
+    [
+        ("monthly", MONTHLY_DATES),
+        ("daily", DAILY_DATES),
+    ],
+)
+def test_create_date_list(mock_chirps, frequency, date_list_control):
+    """Test the dates of interest for monthly and daily data."""
+    date_list = mock_chirps(frequency=frequency)._create_date_list()
+
+    assert tuple(d.date() for d in date_list) == date_list_control
+
+
+@pytest.mark.parametrize(
+    "frequency, urls_control, filename_list_control",
+    [
+        ("monthly", MONTHLY_URLS, MONTHLY_FILENAME_LIST),
+        ("daily", DAILY_URLS, DAILY_FILENAME_LIST),
+    ],
+)
+def test_download(
+    mock_aa_data_dir,
+    mock_download,
+    frequency,
+    urls_control,
+    filename_list_control,
+):
+    """Test of call download for monthly and daily data."""
+    url_list, filepath_list = mock_download(frequency=frequency)
 
+    raw_dir = mock_aa_data_dir / RAW_PREFIX
     filepath_list_control = [
-        mock_aa_data_dir
-        / (
-            f"public/raw/{mock_country_config.iso3}/{DATASOURCE_BASE_DIR}/"
-            f"abc_chirps_daily_{START_YEAR}_{START_MONTH}_{DAY}_"
-            "r0.05_Np6Sp3Ep2Wm3.nc"
-        )
-        for DAY in range(int(START_DAY), 32)
+        raw_dir / filename for filename in filename_list_control
     ]
 
-    filepath_list_control.append(
-        mock_aa_data_dir
-        / (
-            f"public/raw/{mock_country_config.iso3}/{DATASOURCE_BASE_DIR}/"
-            f"abc_chirps_daily_{START_YEAR}_{END_MONTH}_{END_DAY}_"
-            "r0.05_Np6Sp3Ep2Wm3.nc"
-        )
-    )
-
-    assert url_list == url_list_control
+    assert url_list == list(urls_control)
     assert filepath_list == filepath_list_control
 
 
-def test_process_monthly(
+@pytest.mark.parametrize(
+    "frequency, raw_dataset_fixture, filename_list_control, t_index_control",
+    [
+        (
+            "monthly",
+            "fake_monthly_prcp_dataset",
+            MONTHLY_FILENAME_LIST,
+            EXPECTED_MONTHLY_T_INDEX,
+        ),
+        (
+            "daily",
+            "fake_daily_prcp_dataset",
+            DAILY_FILENAME_LIST,
+            EXPECTED_DAILY_T_INDEX,
+        ),
+    ],
+)
+def test_process(
+    request,
     mocker,
     mock_chirps,
     mock_aa_data_dir,
-    mock_country_config,
     mock_dataset_to_netcdf,
+    frequency,
+    raw_dataset_fixture,
+    filename_list_control,
+    t_index_control,
 ):
-    """Test process monthl data."""
-    ds = xr.DataArray(
-        np.reshape(a=np.arange(8), newshape=(2, 2, 2)),
-        dims=("X", "Y", "T"),
-        coords={
-            "X": [1, 2],
-            "Y": [2, -3],
-            "T": [685.5, 686.5],
-        },
-    ).to_dataset(name="prcp")
-
-    ds["T"].attrs["calendar"] = "360"
-    ds["T"].attrs["units"] = "months since 1960-01-01"
-
-    mock_xr_open_dataset = mocker.patch(
-        "ochanticipy.datasources.chirps.chirps.xr.open_dataset",
-        return_value=ds,
+    """Test process monthly and daily data."""
+    mock_xr_open_dataset = mocker.patch.object(
+        chirps_module.xr,
+        "open_dataset",
+        return_value=request.getfixturevalue(raw_dataset_fixture),
     )
 
+    raw_dir = mock_aa_data_dir / RAW_PREFIX
+    processed_dir = mock_aa_data_dir / PROCESSED_PREFIX
     input_filepath_list_control = [
-        mock_aa_data_dir
-        / (
-            f"public/raw/{mock_country_config.iso3}/"
-            f"{DATASOURCE_BASE_DIR}/"
-            f"abc_chirps_monthly_{START_YEAR}_{MONTH:02d}_"
-            "r0.05_Np6Sp3Ep2Wm3.nc"
-        )
-        for MONTH in range(int(START_MONTH), int(END_MONTH) + 1)
+        raw_dir / filename for filename in filename_list_control
     ]
-
     output_filepath_list_control = [
-        Path(str(f).replace("raw", "processed"))
-        for f in input_filepath_list_control
+        processed_dir / filename for filename in filename_list_control
     ]
 
-    chirps = mock_chirps(frequency="monthly")
+    chirps = mock_chirps(frequency=frequency)
     processed_path = chirps.process()
 
     args_input_process = mock_xr_open_dataset.call_args_list
     input_filepath_list = [k[0] for (k, _) in args_input_process]
+    assert all(k["engine"] == "netcdf4" for (_, k) in args_input_process)
 
     args_output_process = mock_dataset_to_netcdf.call_args_list
     output_filepath_list = [k["path"] for (_, k) in args_output_process]
@@ -300,179 +361,65 @@ def test_process_monthly(
     assert input_filepath_list == input_filepath_list_control
     assert output_filepath_list == output_filepath_list_control
 
-    assert processed_path == (
-        mock_aa_data_dir
-        / f"public/processed/{mock_country_config.iso3}/{DATASOURCE_BASE_DIR}/"
-    )
-
-    expected_f = CFTimeIndex(
-        [
-            cftime.Datetime360Day(year=2017, month=2, day=16),
-            cftime.Datetime360Day(year=2017, month=3, day=16),
-        ]
-    )
+    assert processed_path == processed_dir
 
     assert np.array_equal(output_ds.X.values, [1, 2])
     assert np.array_equal(output_ds.Y.values, [2, -3])
-    assert output_ds.get_index("T").equals(expected_f)
+    assert output_ds.get_index("T").equals(t_index_control)
     assert np.array_equal(
         output_ds.precipitation.values,
-        np.reshape(a=np.arange(8), newshape=(2, 2, 2)),
+        PRCP_VALUES,
     )
 
 
-def test_process_daily(
+def test_process_existing(
     mocker,
     mock_chirps,
     mock_aa_data_dir,
-    mock_country_config,
     mock_dataset_to_netcdf,
 ):
-    """Test process daily data."""
-    ds = xr.DataArray(
-        np.reshape(a=np.arange(8), newshape=(2, 2, 2)),
-        dims=("X", "Y", "T"),
-        coords={
-            "X": [1, 2],
-            "Y": [2, -3],
-            "T": [2454397.0, 2454398.0],
-        },
-    ).to_dataset(name="prcp")
-
-    ds["T"].attrs["calendar"] = "standard"
-    ds["T"].attrs["units"] = "julian_day"
-
-    mock_xr_open_dataset = mocker.patch(
-        "ochanticipy.datasources.chirps.chirps.xr.open_dataset",
-        return_value=ds,
-    )
-
-    input_filepath_list_control = [
-        mock_aa_data_dir
-        / (
-            f"public/raw/{mock_country_config.iso3}/"
-            f"{DATASOURCE_BASE_DIR}/"
-            f"abc_chirps_daily_{START_YEAR}_{START_MONTH}_{DAY}_"
-            "r0.05_Np6Sp3Ep2Wm3.nc"
-        )
-        for DAY in range(int(START_DAY), 32)
-    ]
-
-    input_filepath_list_control.append(
-        mock_aa_data_dir
-        / (
-            f"public/raw/{mock_country_config.iso3}/"
-            f"{DATASOURCE_BASE_DIR}/"
-            f"abc_chirps_daily_{START_YEAR}_{END_MONTH}_{END_DAY}_"
-            "r0.05_Np6Sp3Ep2Wm3.nc"
-        )
-    )
-
-    output_filepath_list_control = [
-        Path(str(f).replace("raw", "processed"))
-        for f in input_filepath_list_control
-    ]
-
-    chirps = mock_chirps(frequency="daily")
-    processed_path = chirps.process()
-
-    args_input_process = mock_xr_open_dataset.call_args_list
-    input_filepath_list = [k[0] for (k, _) in args_input_process]
-
-    args_output_process = mock_dataset_to_netcdf.call_args_list
-    output_filepath_list = [k["path"] for (_, k) in args_output_process]
-    output_dataset_list = [k[0] for (k, _) in args_output_process]
-    output_ds = output_dataset_list[0]
-
-    assert input_filepath_list == input_filepath_list_control
-    assert output_filepath_list == output_filepath_list_control
-
-    assert processed_path == (
-        mock_aa_data_dir
-        / f"public/processed/{mock_country_config.iso3}/{DATASOURCE_BASE_DIR}/"
+    """Test that raw files are not opened if already processed."""
+    mock_xr_open_dataset = mocker.patch.object(
+        chirps_module.xr, "open_dataset"
     )
-
-    expected_f = CFTimeIndex(
-        [
-            cftime.DatetimeGregorian(year=2007, month=10, day=23, hour=12),
-            cftime.DatetimeGregorian(year=2007, month=10, day=24, hour=12),
-        ]
-    )
-
-    assert np.array_equal(output_ds.X.values, [1, 2])
-    assert np.array_equal(output_ds.Y.values, [2, -3])
-    assert output_ds.get_index("T").equals(expected_f)
-    assert np.array_equal(
-        output_ds.precipitation.values,
-        np.reshape(a=np.arange(8), newshape=(2, 2, 2)),
-    )
-
-
-def test_chirps_load_monthly(
-    mock_xr_open_multiple_dataset,
-    mock_chirps,
-    mock_aa_data_dir,
-    mock_country_config,
-):
-    """Test load monthly data."""
-    filepath_list_control = [
-        mock_aa_data_dir
-        / (
-            f"public/processed/{mock_country_config.iso3}/"
-            f"{DATASOURCE_BASE_DIR}/"
-            f"abc_chirps_monthly_{START_YEAR}_{MONTH:02d}_"
-            "r0.05_Np6Sp3Ep2Wm3.nc"
-        )
-        for MONTH in range(int(START_MONTH), int(END_MONTH) + 1)
-    ]
+    processed_dir = mock_aa_data_dir / PROCESSED_PREFIX
+    processed_dir.mkdir(parents=True)
+    for filename in MONTHLY_FILENAME_LIST:
+        (processed_dir / filename).touch()
 
     chirps = mock_chirps(frequency="monthly")
-    chirps.load()
-    args_download = mock_xr_open_multiple_dataset.call_args
-    filepath_list = args_download[0][0]
-
-    ds = mock_xr_open_multiple_dataset()
+    processed_path = chirps.process()
 
-    assert ds.attrs["included_files"] == [
-        filepath.stem for filepath in filepath_list
-    ]
-    assert filepath_list == filepath_list_control
+    assert processed_path == processed_dir
+    mock_xr_open_dataset.assert_not_called()
+    mock_dataset_to_netcdf.assert_not_called()
 
 
-def test_chirps_load_daily(
+@pytest.mark.parametrize(
+    "frequency, filename_list_control",
+    [
+        ("monthly", MONTHLY_FILENAME_LIST),
+        ("daily", DAILY_FILENAME_LIST),
+    ],
+)
+def test_chirps_load(
     mock_xr_open_multiple_dataset,
     mock_chirps,
     mock_aa_data_dir,
-    mock_country_config,
+    frequency,
+    filename_list_control,
 ):
-    """Test load daily data."""
+    """Test load monthly and daily data."""
+    processed_dir = mock_aa_data_dir / PROCESSED_PREFIX
     filepath_list_control = [
-        mock_aa_data_dir
-        / (
-            f"public/processed/{mock_country_config.iso3}/"
-            f"{DATASOURCE_BASE_DIR}/"
-            f"abc_chirps_daily_{START_YEAR}_{START_MONTH}_{DAY}_"
-            "r0.05_Np6Sp3Ep2Wm3.nc"
-        )
-        for DAY in range(int(START_DAY), 32)
+        processed_dir / filename for filename in filename_list_control
     ]
 
-    filepath_list_control.append(
-        mock_aa_data_dir
-        / (
-            f"public/processed/{mock_country_config.iso3}/"
-            f"{DATASOURCE_BASE_DIR}/"
-            f"abc_chirps_daily_{START_YEAR}_{END_MONTH}_{END_DAY}_"
-            "r0.05_Np6Sp3Ep2Wm3.nc"
-        )
-    )
-
-    chirps = mock_chirps(frequency="daily")
-    chirps.load()
+    chirps = mock_chirps(frequency=frequency)
+    ds = chirps.load()
     args_download = mock_xr_open_multiple_dataset.call_args
     filepath_list = args_download[0][0]
-
-    ds = mock_xr_open_multiple_dataset()
+    assert args_download[1]["engine"] == "netcdf4"
 
     assert ds.attrs["included_files"] == [
         filepath.stem for filepath in filepath_list
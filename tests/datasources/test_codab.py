@@ -3,113 +3,95 @@ from unittest.mock import call
 
 import pytest
 
-from ochanticipy import CodAB, create_custom_country_config
+from ochanticipy import CodAB
+from ochanticipy.datasources.codab import codab as codab_module
 
 DATASOURCE_BASE_DIR = "cod_ab"
-MULTI_RESOURCE_CONFIG = "tests/datasources/fake_codab_multi.yaml"
-
-
-@pytest.fixture
-def mock_config_multi():
-    """Fixture for CODAB with multiple resources."""
-    return create_custom_country_config(filepath=MULTI_RESOURCE_CONFIG)
 
 
 @pytest.fixture
 def downloader(mocker):
     """Mock the HDX download function."""
-    return mocker.patch(
-        "ochanticipy.datasources.codab.codab.load_resource_from_hdx"
-    )
+    return mocker.patch.object(codab_module, "load_resource_from_hdx")
 
 
 @pytest.fixture
 def gpd_read_file(mocker):
     """Mock GeoPandas file reading function."""
-    return mocker.patch("ochanticipy.datasources.codab.codab.gpd.read_file")
-
-
-def test_codab_download(mock_aa_data_dir, mock_country_config, downloader):
-    """Test that load_codab calls the HDX API to download."""
-    codab = CodAB(country_config=mock_country_config)
-    codab.download()
-    downloader.assert_called_with(
-        hdx_dataset=f"cod-ab-{mock_country_config.iso3}",
-        hdx_resource_name=mock_country_config.codab.hdx_resource_name,
-        output_filepath=mock_aa_data_dir
-        / f"public/raw/{mock_country_config.iso3}/"
-        f"{DATASOURCE_BASE_DIR}/{mock_country_config.iso3}_adm.shp.zip",
-    )
-
-
-def test_codab_download_multi(mock_aa_data_dir, mock_config_multi, downloader):
-    """Test that download calls the HDX API to download for multi resources."""
-    codab = CodAB(country_config=mock_config_multi)
+    return mocker.patch.object(codab_module.gpd, "read_file")
+
+
+@pytest.mark.parametrize(
+    "config_fixture, resource_file_list",
+    [
+        ("mock_country_config", [("fake_hdx_resource_name", "adm")]),
+        (
+            "mock_config_multi",
+            [(f"fake_hdx_resource_{i}", f"adm{i}") for i in range(4)],
+        ),
+    ],
+)
+def test_codab_download(
+    request, mock_aa_data_dir, downloader, config_fixture, resource_file_list
+):
+    """Test that download calls the HDX API for single and multi resources."""
+    country_config = request.getfixturevalue(config_fixture)
+    codab = CodAB(country_config=country_config)
     codab.download()
-    downloader.assert_has_calls(
-        [
-            call(
-                hdx_dataset=f"cod-ab-{mock_config_multi.iso3}",
-                hdx_resource_name=mock_config_multi.codab.hdx_resource_name[i],
-                output_filepath=mock_aa_data_dir
-                / f"public/raw/{mock_config_multi.iso3}/"
-                f"{DATASOURCE_BASE_DIR}/{mock_config_multi.iso3}_"
-                f"adm{i}.shp.zip",
-            )
-            for i in range(4)
-        ]
-    )
-
-
+    assert downloader.call_args_list == [
+        call(
+            hdx_dataset=f"cod-ab-{country_config.iso3}",
+            hdx_resource_name=hdx_resource_name,
+            output_filepath=mock_aa_data_dir
+            / f"public/raw/{country_config.iso3}/"
+            f"{DATASOURCE_BASE_DIR}/{country_config.iso3}_"
+            f"{file_suffix}.shp.zip",
+        )
+        for hdx_resource_name, file_suffix in resource_file_list
+    ]
+
+
+@pytest.mark.parametrize(
+    "config_fixture, admin_level, file_suffix, expected_layer_name",
+    [
+        # layer_base_name
+        ("mock_country_config", 1, "adm", "fake_layer_base_name_level1"),
+        # custom name
+        ("mock_country_config", 2, "adm", "admin2_custom_name"),
+        ("mock_config_multi", 1, "adm1", "fake_layer_base_name_level1"),
+    ],
+)
 def test_codab_load_admin_level(
-    mock_aa_data_dir, mock_country_config, gpd_read_file
+    request,
+    mock_aa_data_dir,
+    gpd_read_file,
+    config_fixture,
+    admin_level,
+    file_suffix,
+    expected_layer_name,
 ):
     """Test that load_codab retrieves expected file and layer name."""
-    codab = CodAB(country_config=mock_country_config)
-
-    # First checking layer_base_name
-    expected_layer_name = "fake_layer_base_name_level1"
-    codab.load(admin_level=1)
+    country_config = request.getfixturevalue(config_fixture)
+    codab = CodAB(country_config=country_config)
+    codab.load(admin_level=admin_level)
 
     gpd_read_file.assert_called_with(
-        f"zip://{mock_aa_data_dir}/public/raw/{mock_country_config.iso3}/"
-        f"{DATASOURCE_BASE_DIR}/{mock_country_config.iso3}_"
-        f"adm.shp.zip/{expected_layer_name}"
+        f"zip://{mock_aa_data_dir}/public/raw/{country_config.iso3}/"
+        f"{DATASOURCE_BASE_DIR}/{country_config.iso3}_"
+        f"{file_suffix}.shp.zip/{expected_layer_name}"
     )
 
-    # Then checking custom name
-    expected_layer_name = "admin2_custom_name"
-    codab.load(admin_level=2)
 
-    gpd_read_file.assert_called_with(
-        f"zip://{mock_aa_data_dir}/public/raw/{mock_country_config.iso3}/"
-        f"{DATASOURCE_BASE_DIR}/{mock_country_config.iso3}_"
-        f"adm.shp.zip/{expected_layer_name}"
-    )
-
-
-def test_codab_multi_load_admin_level(
-    mock_aa_data_dir, mock_config_multi, gpd_read_file
-):
-    """Test that load_codab retrieves expected file and layer name."""
-    codab = CodAB(country_config=mock_config_multi)
-
-    # First checking layer_base_name
-    expected_layer_name = "fake_layer_base_name_level1"
-    codab.load(admin_level=1)
-
-    gpd_read_file.assert_called_with(
-        f"zip://{mock_aa_data_dir}/public/raw/{mock_config_multi.iso3}/"
-        f"{DATASOURCE_BASE_DIR}/{mock_config_multi.iso3}_"
-        f"adm1.shp.zip/{expected_layer_name}"
-    )
+@pytest.fixture
+def codab_without_data(session_country_config):
+    """Create CodAB class for tests that fail before accessing any file."""
+    return CodAB(country_config=session_country_config)
 
 
-def test_codab_too_high_admin_level(mock_country_config):
+def test_codab_too_high_admin_level(codab_without_data):
     """Test raised error when too high admin level requested."""
-    codab = CodAB(country_config=mock_country_config)
     with pytest.raises(AttributeError):
-        codab.load(admin_level=10)
+        codab_without_data.load(admin_level=10)
 
 
 def test_codab_custom(mock_aa_data_dir, mock_country_config, gpd_read_file):
@@ -128,11 +110,10 @@ def test_codab_custom(mock_aa_data_dir, mock_country_config, gpd_read_file):
     )
 
 
-def test_codab_custom_missing(mock_country_config, gpd_read_file):
+def test_codab_custom_missing(codab_without_data):
     """Test raised error when custom COD AB missing."""
-    codab = CodAB(country_config=mock_country_config)
     with pytest.raises(AttributeError):
-        codab.load_custom(0)
+        codab_without_data.load_custom(0)
 
 
 def test_codab_load_fail(mock_country_config):
@@ -1,115 +1,104 @@
 """Tests for the FewsNet module."""
 import zipfile
+from pathlib import PurePosixPath
 
 import pytest
 from conftest import ISO2
 
 from ochanticipy.config.countryconfig import FewsNetConfig
+from ochanticipy.datasources.fewsnet import fewsnet as fewsnet_module
 from ochanticipy.datasources.fewsnet.fewsnet import FewsNet
 
 DATASOURCE_BASE_DIR = "fewsnet"
 _PUB_YEAR = 2020
 _PUB_MONTH = 7
-_PUB_MONTH_STR = f"{7:02d}"
+_PUB_MONTH_STR = f"{_PUB_MONTH:02d}"
+_RAW_DIR = PurePosixPath("public/raw/glb") / DATASOURCE_BASE_DIR
+_COUNTRY_DIR_NAME = f"{ISO2.upper()}_{_PUB_YEAR}{_PUB_MONTH_STR}"
+_REGION_DIR_NAME = f"EA_{_PUB_YEAR}{_PUB_MONTH_STR}"
+_EXPECTED_COUNTRY_URL = (
+    "https://fdw.fews.net/api/ipcpackage/"
+    f"?country_code={ISO2.upper()}&collection_date={_PUB_YEAR}-"
+    f"{_PUB_MONTH_STR}-01"
+)
+_EXPECTED_REGION_URL = (
+    "https://fews.net/data_portal_download/download?"
+    "data_file_path=http://shapefiles.fews.net.s3.amazonaws.com/"
+    f"HFIC/EA/east-africa{_PUB_YEAR}{_PUB_MONTH_STR}.zip"
+)
 
 
-@pytest.fixture(autouse=True)
-def mock_iso2(mocker, request):
+@pytest.fixture
+def mock_iso2(mocker):
     """Mock iso2 to iso3 conversion."""
-    if request.node.get_closest_marker("nomockiso2"):
-        return
-    mocker.patch(
-        "ochanticipy.datasources.fewsnet.fewsnet.Country.get_iso2_from_iso3",
+    mocker.patch.object(
+        fewsnet_module.Country,
+        "get_iso2_from_iso3",
         return_value=ISO2.upper(),
     )
 
 
-@pytest.mark.nomockiso2
 def test_no_iso2(mock_country_config):
     """
     Test that if no valid iso2 can be found, a keyerror is returned.
 
     Since we use a fake iso3, no iso2 can be found and thus should produce an
-    error. For the other tests, we mock the iso3-to-iso2 conversion to prevent
-    this error.
+    error. The tests that build a FewsNet instance use the mock_iso2 fixture
+    to mock the iso3-to-iso2 conversion and prevent this error.
     """
     with pytest.raises(KeyError):
         FewsNet(country_config=mock_country_config)
 
 
-def test_download_country(
-    mock_aa_data_dir, mock_country_config, mock_download_call, mocker
+@pytest.mark.usefixtures("mock_iso2")
+@pytest.mark.parametrize(
+    "mock_countryregion, expected_url, expected_dir_name",
+    [
+        pytest.param(
+            (True, False),
+            _EXPECTED_COUNTRY_URL,
+            _COUNTRY_DIR_NAME,
+            id="country",
+        ),
+        pytest.param(
+            (False, True), _EXPECTED_REGION_URL, _REGION_DIR_NAME, id="region"
+        ),
+    ],
+    indirect=["mock_countryregion"],
+)
+def test_download(
+    mock_aa_data_dir,
+    mock_country_config,
+    mock_download_call,
+    expected_url,
+    expected_dir_name,
 ):
-    """Test that the correct country url and path is returned."""
+    """Test that the correct country or region url and path is returned."""
     fewsnet = FewsNet(country_config=mock_country_config)
     url, output_path = mock_download_call(
         fewsnet_class=fewsnet,
         pub_year=_PUB_YEAR,
         pub_month=_PUB_MONTH,
-        country_data=True,
-        region_data=False,
-    )
-    assert (
-        url == "https://fdw.fews.net/api/ipcpackage/"
-        f"?country_code={ISO2.upper()}&collection_date={_PUB_YEAR}-"
-        f"{_PUB_MONTH_STR}-01"
-    )
-    assert (
-        output_path
-        == mock_aa_data_dir
-        / "public"
-        / "raw"
-        / "glb"
-        / DATASOURCE_BASE_DIR
-        / f"{ISO2.upper()}_{_PUB_YEAR}{_PUB_MONTH_STR}"
-    )
-
-
-def test_download_region(
-    mock_aa_data_dir, mock_country_config, mock_download_call
-):
-    """Test that the correct region url and path is returned."""
-    fewsnet = FewsNet(country_config=mock_country_config)
-    url, output_path = mock_download_call(
-        fewsnet_class=fewsnet,
-        pub_year=_PUB_YEAR,
-        pub_month=_PUB_MONTH,
-        country_data=False,
-        region_data=True,
-    )
-
-    assert (
-        url == f"https://fews.net/data_portal_download/download?"
-        "data_file_path=http://shapefiles.fews.net.s3.amazonaws.com/"
-        f"HFIC/EA/east-africa{_PUB_YEAR}{_PUB_MONTH_STR}.zip"
-    )
-    assert (
-        output_path
-        == mock_aa_data_dir
-        / "public"
-        / "raw"
-        / "glb"
-        / DATASOURCE_BASE_DIR
-        / f"EA_{_PUB_YEAR}{_PUB_MONTH_STR}"
     )
+    assert url == expected_url
+    assert output_path == mock_aa_data_dir / _RAW_DIR / expected_dir_name
 
 
+@pytest.mark.usefixtures("mock_iso2")
+@pytest.mark.parametrize("mock_countryregion", [(False, False)], indirect=True)
 def test_download_nodata(mock_country_config, mock_download_call):
     """Test that RuntimeError is returned when no data exists."""
-    with pytest.raises(RuntimeError) as e:
-        fewsnet = FewsNet(country_config=mock_country_config)
-        url, output_path = mock_download_call(
+    fewsnet = FewsNet(country_config=mock_country_config)
+    with pytest.raises(
+        RuntimeError,
+        match="No country or regional data found for "
+        f"{_PUB_YEAR}-{_PUB_MONTH_STR}",
+    ):
+        mock_download_call(
             fewsnet_class=fewsnet,
             pub_year=_PUB_YEAR,
             pub_month=_PUB_MONTH,
-            country_data=False,
-            region_data=False,
         )
-        assert output_path is None
-    assert (
-        f"No country or regional data found for {_PUB_YEAR}-{_PUB_MONTH_STR}"
-        in str(e.value)
-    )
 
 
 def test_invalid_region_name():
@@ -121,13 +110,21 @@ def test_invalid_region_name():
         )
 
 
-def test_date_valid(mock_country_config):
+@pytest.mark.parametrize(
+    "pub_year, pub_month",
+    [
+        # not a valid date
+        (2000, 13),
+        # before FEWS NET started publishing
+        (2000, 12),
+        # in the future
+        (2100, 12),
+    ],
+)
+def test_date_valid(pub_year, pub_month):
     """Test error when input date is not valid."""
-    fewsnet = FewsNet(country_config=mock_country_config)
     with pytest.raises(ValueError):
-        fewsnet._check_date_validity(pub_year=2000, pub_month=13)
-        fewsnet._check_date_validity(pub_year=2000, pub_month=12)
-        fewsnet._check_date_validity(pub_year=2100, pub_month=12)
+        FewsNet._check_date_validity(pub_year=pub_year, pub_month=pub_month)
 
 
 @pytest.fixture
@@ -135,11 +132,7 @@ def mock_download_call(mock_fake_url, mock_countryregion):
     """Mock call to download."""
     url_mock = mock_fake_url
 
-    def _get_country_mock(
-        fewsnet_class, pub_year, pub_month, country_data, region_data
-    ):
-        mock_countryregion(country_data, region_data)
-
+    def _get_country_mock(fewsnet_class, pub_year, pub_month):
         output_path = fewsnet_class.download(
             pub_year=pub_year, pub_month=pub_month
         )
@@ -155,74 +148,54 @@ def mock_download_call(mock_fake_url, mock_countryregion):
 @pytest.fixture
 def mock_fake_url(mocker):
     """Mock url and unzip call."""
-    fakedownloadurl = mocker.patch(
-        "ochanticipy.datasources.fewsnet.fewsnet.download_url"
-    )
-    mocker.patch("ochanticipy.datasources.fewsnet.fewsnet.unzip")
+    fakedownloadurl = mocker.patch.object(fewsnet_module, "download_url")
+    mocker.patch.object(fewsnet_module, "unzip")
     return fakedownloadurl
 
 
 @pytest.fixture
-def mock_countryregion(mocker):
-    """Mock that no country and/or region data exists."""
-
-    def _mock_countryregion(country_data: bool, region_data: bool):
-        if country_data:
-            return None
-        else:
-            if region_data:
-                return mocker.patch(
-                    "ochanticipy.datasources.fewsnet.fewsnet."
-                    "FewsNet._download_country",
-                    side_effect=zipfile.BadZipFile,
-                )
-            else:
-                return mocker.patch(
-                    "ochanticipy.datasources.fewsnet.fewsnet."
-                    "FewsNet._download_country",
-                    side_effect=zipfile.BadZipFile,
-                ), mocker.patch(
-                    "ochanticipy.datasources.fewsnet.fewsnet."
-                    "FewsNet._download_region",
-                    side_effect=zipfile.BadZipFile,
-                )
-
-    return _mock_countryregion
+def mock_countryregion(mocker, request):
+    """
+    Mock that no country and/or region data exists.
+
+    Parametrize indirectly with a ``(country_data, region_data)`` tuple.
+    """
+    country_data, region_data = request.param
+    if not country_data:
+        mocker.patch.object(
+            FewsNet, "_download_country", side_effect=zipfile.BadZipFile
+        )
+        if not region_data:
+            mocker.patch.object(
+                FewsNet, "_download_region", side_effect=zipfile.BadZipFile
+            )
 
 
 @pytest.fixture
 def mock_gpd_read_file(mocker):
     """Mock GeoPandas file reading function."""
-    return mocker.patch(
-        "ochanticipy.datasources.fewsnet.fewsnet.gpd.read_file"
-    )
+    return mocker.patch.object(fewsnet_module.gpd, "read_file")
 
 
-def test_load(
-    mock_country_config, mock_aa_data_dir, mock_gpd_read_file, mocker
-):
+@pytest.mark.usefixtures("mock_iso2")
+def test_load(mock_country_config, mock_aa_data_dir, mock_gpd_read_file):
     """Test loading of fewsnet data."""
     fewsnet = FewsNet(country_config=mock_country_config)
-    mocker.patch("pathlib.Path.is_dir", return_value=True)
-    mocker.patch("pathlib.Path.is_file", return_value=True)
+    filepath = (
+        mock_aa_data_dir
+        / _RAW_DIR
+        / _COUNTRY_DIR_NAME
+        / f"{_COUNTRY_DIR_NAME}_CS.shp"
+    )
+    filepath.parent.mkdir(parents=True)
+    filepath.touch()
     fewsnet.load(
         pub_year=_PUB_YEAR, pub_month=_PUB_MONTH, projection_period="CS"
     )
-    mock_gpd_read_file.assert_has_calls(
-        [
-            mocker.call(
-                mock_aa_data_dir
-                / "public"
-                / "raw"
-                / "glb"
-                / DATASOURCE_BASE_DIR
-                / f"{ISO2.upper()}_{_PUB_YEAR}{_PUB_MONTH_STR}"
-                / f"{ISO2.upper()}_{_PUB_YEAR}{_PUB_MONTH_STR}_CS.shp"
-            ),
-        ]
-    )
+    mock_gpd_read_file.assert_called_once_with(filepath)
 
 
+@pytest.mark.usefixtures("mock_iso2")
 def test_invalid_projection_period(mock_country_config):
     """Test that fails when projection_period is not one of the options."""
     fewsnet = FewsNet(country_config=mock_country_config)
@@ -232,13 +205,14 @@ def test_invalid_projection_period(mock_country_config):
         )
 
 
+@pytest.mark.usefixtures("mock_iso2")
 def test_download_clobber(mock_country_config, mock_fake_url):
     """Test that download URL is not called if directory exists."""
     fewsnet = FewsNet(country_config=mock_country_config)
     filepath = fewsnet._get_raw_dir_date(
         area=fewsnet._iso2,
         pub_year=_PUB_YEAR,
-        pub_month_str=f"{_PUB_MONTH:02d}",
+        pub_month_str=_PUB_MONTH_STR,
     )
     filepath.mkdir(parents=True)
     fewsnet.download(pub_year=_PUB_YEAR, pub_month=_PUB_MONTH, clobber=False)
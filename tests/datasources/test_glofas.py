@@ -1,170 +1,215 @@
 """Test the GloFAS instantiation."""
+import importlib.util
 import sys
 from datetime import date
 
 import pytest
 
 from ochanticipy import GlofasForecast, GlofasReanalysis, GlofasReforecast
+from ochanticipy.datasources.glofas import glofas as glofas_module
+
+
+@pytest.mark.parametrize(
+    (
+        "glofas_class, kwargs, good_end_date, future_start_date, "
+        "start_date_min, end_date_max"
+    ),
+    [
+        pytest.param(
+            GlofasReanalysis,
+            {},
+            "2022-11-15",
+            None,
+            date(year=1979, month=1, day=1),
+            None,
+            id="reanalysis",
+        ),
+        pytest.param(
+            GlofasForecast,
+            {"leadtime_max": 15},
+            "2022-05-15",
+            # avoid exceeding the max number of requests
+            "today",
+            date(year=2021, month=5, day=26),
+            None,
+            id="forecast",
+        ),
+        pytest.param(
+            GlofasReforecast,
+            {"leadtime_max": 15},
+            "2010-01-01",
+            None,
+            date(year=2003, month=3, day=1),
+            date(year=2022, month=8, day=31),
+            id="reforecast",
+        ),
+        pytest.param(
+            GlofasReforecast,
+            {"leadtime_max": 15, "model_version": 3},
+            "2010-01-01",
+            None,
+            date(year=1999, month=1, day=1),
+            date(year=2018, month=12, day=31),
+            id="reforecast_v3",
+        ),
+    ],
+)
+def test_dates(
+    session_country_config,
+    geo_bounding_box,
+    glofas_class,
+    kwargs,
+    good_end_date,
+    future_start_date,
+    start_date_min,
+    end_date_max,
+):
+    """
+    Test date range behaviour.
 
+    An ``end_date_max`` of None means that the end date is capped at today,
+    and a ``future_start_date`` of "today" is replaced by today's date.
+    """
 
-def test_reanalysis_dates(mock_country_config, geo_bounding_box):
-    """Test date range behaviour of reanalysis."""
-
-    def glofas_reanalysis(end_date: date, start_date: date = None):
-        return GlofasReanalysis(
-            country_config=mock_country_config,
-            geo_bounding_box=geo_bounding_box,
-            start_date=start_date,
-            end_date=end_date,
-        )
-
-    # Try using a string as a date
-    good_end_date = "2022-11-15"
-    # These should not throw an error
-    glofas_reanalysis(end_date=good_end_date)
-    # End date too far in future
-    glofas_future = glofas_reanalysis(end_date=date(year=3000, month=1, day=1))
-    assert glofas_future._end_date == date.today()
-    # Start date too early
-    glofas_past = glofas_reanalysis(
-        start_date=date(year=1800, month=1, day=1), end_date=good_end_date
-    )
-    assert glofas_past._start_date == date(year=1979, month=1, day=1)
-    # End date > start date
-    with pytest.raises(ValueError):
-        glofas_reanalysis(
-            start_date=date(year=2020, month=1, day=2),
-            end_date=date(year=2020, month=1, day=1),
-        )
-
-
-def test_forecast_dates(mock_country_config, geo_bounding_box):
-    """Test date range behaviour of forecast."""
-
-    def glofas_forecast(end_date: date, start_date: date = None):
-        return GlofasForecast(
-            country_config=mock_country_config,
+    def make_glofas(end_date: date, start_date: date = None):
+        return glofas_class(
+            country_config=session_country_config,
             geo_bounding_box=geo_bounding_box,
             start_date=start_date,
             end_date=end_date,
-            leadtime_max=15,
+            **kwargs,
         )
 
-    # Try using a string as a date
-    good_end_date = "2022-05-15"
-    # These should not throw an error
-    glofas_forecast(end_date=good_end_date)
+    today = date.today()
+    # Try using a string as a date, this should not throw an error
+    make_glofas(end_date=good_end_date)
     # End date too far in future
-    glofas_future = glofas_forecast(
-        start_date=date.today(), end_date=date(year=3000, month=1, day=1)
+    glofas_future = make_glofas(
+        start_date=today if future_start_date == "today" else None,
+        end_date=date(year=3000, month=1, day=1),
     )
-    assert glofas_future._end_date == date.today()
+    assert glofas_future._end_date == (end_date_max or today)
     # Start date too early
-    glofas_past = glofas_forecast(
+    glofas_past = make_glofas(
         start_date=date(year=1800, month=1, day=1), end_date=good_end_date
     )
-    assert glofas_past._start_date == date(year=2021, month=5, day=26)
+    assert glofas_past._start_date == start_date_min
     # End date > start date
     with pytest.raises(ValueError):
-        glofas_forecast(
+        make_glofas(
             start_date=date(year=2020, month=1, day=2),
             end_date=date(year=2020, month=1, day=1),
         )
 
 
-def test_reforecast_dates(mock_country_config, geo_bounding_box):
-    """Test date range behaviour of reforecast."""
-
-    def glofas_reforecast(start_date: date = None, end_date: date = None):
-        return GlofasReforecast(
-            country_config=mock_country_config,
-            geo_bounding_box=geo_bounding_box,
-            start_date=start_date,
-            end_date=end_date,
-            leadtime_max=15,
-        )
+@pytest.mark.parametrize(
+    "kwargs, start_date, end_date",
+    [
+        pytest.param(
+            {},
+            date(year=2003, month=3, day=1),
+            date(year=2022, month=8, day=31),
+            id="reforecast",
+        ),
+        pytest.param(
+            {"model_version": 3},
+            date(year=1999, month=1, day=1),
+            date(year=2018, month=12, day=31),
+            id="reforecast_v3",
+        ),
+    ],
+)
+def test_reforecast_default_dates(
+    session_country_config, geo_bounding_box, kwargs, start_date, end_date
+):
+    """Test that reforecast covers the full date range by default."""
+    glofas_reforecast = GlofasReforecast(
+        country_config=session_country_config,
+        geo_bounding_box=geo_bounding_box,
+        leadtime_max=15,
+        **kwargs,
+    )
+    assert glofas_reforecast._start_date == start_date
+    assert glofas_reforecast._end_date == end_date
 
-    def glofas_reforecast_v3(start_date: date = None, end_date: date = None):
-        return GlofasReforecast(
-            country_config=mock_country_config,
-            geo_bounding_box=geo_bounding_box,
-            start_date=start_date,
-            end_date=end_date,
-            leadtime_max=15,
-            model_version=3,
-        )
 
-    # These should not throw an error
-    glofas_reforecast()
-    # Try using a string as a date
-    glofas_reforecast(end_date="2010-01-01")
-    # End date too far in future
-    glofas_future = glofas_reforecast(end_date=date(year=3000, month=1, day=1))
-    assert glofas_future._end_date == date(year=2022, month=8, day=31)
-    glofas_future_v3 = glofas_reforecast_v3(
-        end_date=date(year=3000, month=1, day=1)
-    )
-    assert glofas_future_v3._end_date == date(year=2018, month=12, day=31)
-    # Start date too early
-    glofas_past = glofas_reforecast(start_date=date(year=1800, month=1, day=1))
-    assert glofas_past._start_date == date(year=2003, month=3, day=1)
-    glofas_past_v3 = glofas_reforecast_v3(
-        start_date=date(year=1800, month=1, day=1)
-    )
-    assert glofas_past_v3._start_date == date(year=1999, month=1, day=1)
-    # End date > start date
-    with pytest.raises(ValueError):
-        glofas_reforecast(
-            start_date=date(year=2020, month=1, day=2),
-            end_date=date(year=2020, month=1, day=1),
-        )
-    # Date range only has forbidden months
+def test_reforecast_forbidden_months(session_country_config, geo_bounding_box):
+    """Test that reforecast date range can't only have forbidden months."""
     with pytest.raises(ValueError):
-        glofas_reforecast(
+        GlofasReforecast(
+            country_config=session_country_config,
+            geo_bounding_box=geo_bounding_box,
             start_date=date(year=2020, month=9, day=1),
             end_date=date(year=2021, month=2, day=1),
-        )
-
-
-def test_optional_module_error(
-    mock_country_config, geo_bounding_box, monkeypatch
-):
-    """Test module error raised correctly if dependencies missing."""
-    monkeypatch.setitem(sys.modules, "cdsapi", None)  # noqa: FKA01
-    with pytest.raises(ModuleNotFoundError, match=r"ochanticipy"):
-        from ochanticipy import GlofasForecast
-
-        GlofasForecast(
-            country_config=mock_country_config,
-            geo_bounding_box=geo_bounding_box,
-            leadtime_max=1,
+            leadtime_max=15,
         )
 
 
 def test_optional_module_no_error(monkeypatch):
-    """Test no errors generated on library import w/o dependencies."""
-    monkeypatch.setitem(sys.modules, "cdsapi", None)  # noqa: FKA01
-    import ochanticipy  # noqa: F401
-
-
-def test_max_requests(mock_country_config, geo_bounding_box):
-    """Test that max request number can't be exceeded."""
-    with pytest.raises(RuntimeError):
-        GlofasForecast(
-            country_config=mock_country_config,
-            geo_bounding_box=geo_bounding_box,
-            leadtime_max=15,
-            start_date=date(year=2021, month=5, day=26),
-            end_date=date(year=2023, month=5, day=29),
-        )
+    """
+    Test no errors generated on module import w/o dependencies.
 
-
-def test_incorrect_model_version(mock_country_config, geo_bounding_box):
-    """Test that incorrect model version raises an error."""
-    with pytest.raises(ValueError):
+    The module is executed from its file without being registered, so that
+    the GloFAS module loaded in this session is left untouched.
+    """
+    monkeypatch.setitem(sys.modules, "cdsapi", None)  # noqa: FKA01
+    spec = importlib.util.spec_from_file_location(
+        name="glofas_without_cdsapi", location=glofas_module.__file__
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+
+@pytest.mark.parametrize(
+    "kwargs, missing_cdsapi, expected_error, match",
+    [
+        pytest.param(
+            {"leadtime_max": 1},
+            True,
+            ModuleNotFoundError,
+            r"ochanticipy",
+            id="optional_module_missing",
+        ),
+        pytest.param(
+            {
+                "leadtime_max": 15,
+                "start_date": date(year=2021, month=5, day=26),
+                "end_date": date(year=2023, month=5, day=29),
+            },
+            False,
+            RuntimeError,
+            None,
+            id="max_requests",
+        ),
+        pytest.param(
+            {"leadtime_max": 15, "model_version": 10},
+            False,
+            ValueError,
+            None,
+            id="incorrect_model_version",
+        ),
+    ],
+)
+def test_forecast_errors(
+    session_country_config,
+    geo_bounding_box,
+    monkeypatch,
+    kwargs,
+    missing_cdsapi,
+    expected_error,
+    match,
+):
+    """
+    Test the errors raised when instantiating the forecast.
+
+    These are a missing optional dependency, exceeding the max number of
+    requests, and an incorrect model version.
+    """
+    if missing_cdsapi:
+        monkeypatch.setitem(sys.modules, "cdsapi", None)  # noqa: FKA01
+    with pytest.raises(expected_error, match=match):
         GlofasForecast(
-            country_config=mock_country_config,
+            country_config=session_country_config,
             geo_bounding_box=geo_bounding_box,
-            leadtime_max=15,
-            model_version=10,
+            **kwargs,
         )
@@ -3,7 +3,6 @@ from datetime import date
 from typing import List, Union
 
 import numpy as np
-import pandas as pd
 import pytest
 import xarray as xr
 
@@ -15,6 +14,19 @@ from ochanticipy import (
     GlofasReforecast,
 )
 
+_SINGLE_DAY = np.datetime64("2014-09-06", "ns")
+_TWO_DAYS = np.array(["2014-09-06", "2014-09-07"], dtype="datetime64[ns]")
+
+
+def _get_axis(start: float, stop: float) -> np.ndarray:
+    """
+    Get the 0.1 degree cell centres between start and stop.
+
+    Generated from integer steps rather than a float step so that
+    floating point errors don't accumulate.
+    """
+    return np.arange(round((stop - start) / 0.1)) * 0.1 + start - 0.05
+
 
 class TestProcess:
     """Tests for GloFAS processing."""
@@ -23,6 +35,8 @@ class TestProcess:
         lat_max=1, lat_min=-2, lon_max=3, lon_min=-4
     )
     numbers = [0, 1, 2, 3, 4, 5, 6]
+    # randomly generated raw datasets, keyed by the get_raw_data arguments
+    _raw_data_cache: dict = {}
 
     def get_raw_data(
         self,
@@ -52,45 +66,53 @@ class TestProcess:
 
         Returns
         -------
-        Simplified GloFAS xarray dataset
+        Simplified GloFAS xarray dataset. Datasets with random discharge
+        values are only generated once, and a shallow copy is returned.
         """
+        cache_key = (
+            tuple(number_coord)
+            if isinstance(number_coord, list)
+            else number_coord,
+            include_step,
+            include_history,
+            single_day,
+        )
+        use_cache = dis24 is None
+        if use_cache and cache_key in self._raw_data_cache:
+            return self._raw_data_cache[cache_key].copy(deep=False)
         rng = np.random.default_rng(12345)
         coords = {}
         if number_coord is not None:
             coords["number"] = number_coord
         if single_day:
-            coords["time"] = np.datetime64("2014-09-06")
+            coords["time"] = _SINGLE_DAY
         else:
-            coords["time"] = pd.date_range("2014-09-06", periods=2)
+            coords["time"] = _TWO_DAYS
         if include_step:
-            coords["step"] = [np.datetime64(n + 1, "D") for n in range(5)]
-        coords["latitude"] = (
-            np.arange(
-                start=self.geo_bounding_box.lat_min,
-                stop=self.geo_bounding_box.lat_max + 2,
-                step=0.1,
-            )
-            - 0.05
+            coords["step"] = np.arange(1, 6).astype("datetime64[D]")
+        coords["latitude"] = _get_axis(
+            start=self.geo_bounding_box.lat_min,
+            stop=self.geo_bounding_box.lat_max + 2,
         )
-        coords["longitude"] = (
-            np.arange(
-                start=self.geo_bounding_box.lon_min,
-                stop=self.geo_bounding_box.lon_max + 2,
-                step=0.1,
-            )
-            - 0.05
+        coords["longitude"] = _get_axis(
+            start=self.geo_bounding_box.lon_min,
+            stop=self.geo_bounding_box.lon_max + 2,
         )
-        dims = list(coords.keys())
-        if number_coord is not None and isinstance(number_coord, int):
-            dims.remove("number")
-        if single_day:
-            dims.remove("time")
+        # scalar coordinates, i.e. a single ensemble member or day, are not
+        # dimensions of the data
+        dims = tuple(dim for dim, coord in coords.items() if np.ndim(coord))
         if dis24 is None:
             dis24 = 5000 + 100 * rng.random([len(coords[dim]) for dim in dims])
+            # the cached values are shared by every copy, so protect them
+            dis24.setflags(write=False)
         attrs = {}
         if include_history:
             attrs = {"history": "fake history"}
-        return xr.Dataset({"dis24": (dims, dis24)}, coords=coords, attrs=attrs)
+        ds = xr.Dataset({"dis24": (dims, dis24)}, coords=coords, attrs=attrs)
+        if use_cache:
+            self._raw_data_cache[cache_key] = ds
+            return ds.copy(deep=False)
+        return ds
 
     @pytest.fixture()
     def mock_ensemble_raw(self):
@@ -118,12 +140,12 @@ class TestProcess:
                 include_history=True,
                 single_day=single_day,
             )
-            expected_dis24 = np.concatenate(
-                (
-                    cf_raw["dis24"].values[np.newaxis, ...],
-                    pf_raw["dis24"].values,
-                )
+            pf_dis24 = pf_raw["dis24"].values
+            expected_dis24 = np.empty(
+                (len(self.numbers), *pf_dis24.shape[1:]), dtype=pf_dis24.dtype
             )
+            expected_dis24[0] = cf_raw["dis24"].values
+            expected_dis24[1:] = pf_dis24
             return cf_raw, pf_raw, expected_dis24
 
         return _mock_ensemble_raw
@@ -174,104 +196,129 @@ class TestProcess:
             coords["time"] = raw_data.time
         if include_step:
             coords["step"] = raw_data.step
+        reporting_points = country_config.glofas.reporting_points
+        point_dis24 = (
+            raw_data["dis24"]
+            .sel(
+                longitude=xr.DataArray(
+                    [
+                        reporting_point.lon
+                        for reporting_point in reporting_points
+                    ],
+                    dims="point",
+                ),
+                latitude=xr.DataArray(
+                    [
+                        reporting_point.lat
+                        for reporting_point in reporting_points
+                    ],
+                    dims="point",
+                ),
+                method="nearest",
+            )
+            .transpose("point", ...)
+        )
+        # iterating over the first axis gives a view per reporting point
         return xr.Dataset(
             {
-                reporting_point.name: (
-                    list(coords.keys()),
-                    raw_data["dis24"]
-                    .sel(
-                        longitude=reporting_point.lon,
-                        latitude=reporting_point.lat,
-                        method="nearest",
-                    )
-                    .data,
+                reporting_point.name: (list(coords.keys()), dis24_point)
+                for reporting_point, dis24_point in zip(
+                    reporting_points, point_dis24.data
                 )
-                for reporting_point in country_config.glofas.reporting_points
             },
             coords=coords,
         )
 
     @pytest.fixture()
-    def mock_processed_data_reanalysis(
-        self, mocker, mock_country_config
+    def mock_processed_data(
+        self, request, mock_ensemble_raw, mocker, session_country_config
     ) -> xr.Dataset:
-        """Create fake processed GloFAS reanalysis data."""
-        mocker.patch(
-            "ochanticipy.datasources.glofas.reanalysis.xr.load_dataset",
-            return_value=self.get_raw_data(),
-        )
-        return self.get_processed_data(country_config=mock_country_config)
-
-    @pytest.fixture()
-    def mock_processed_data_forecast(
-        self, mock_ensemble_raw, mocker, mock_country_config
-    ):
-        """Create fake processed GloFAS forecast or reforecast data."""
+        """
+        Create fake processed GloFAS data.
 
-        def _mock_processed_data_forecast(single_day: bool = False):
-            cf_raw, pf_raw, expected_dis24 = mock_ensemble_raw(
-                single_day=single_day
-            )
+        Parametrize indirectly with the GloFAS product, one of
+        ``"reanalysis"``, ``"reforecast"`` or ``"forecast"``.
+        """
+        if request.param == "reanalysis":
             mocker.patch(
-                "ochanticipy.datasources.glofas.forecast.xr.load_dataset",
-                side_effect=[cf_raw, pf_raw],
+                "ochanticipy.datasources.glofas.reanalysis.xr.load_dataset",
+                return_value=self.get_raw_data(),
             )
             return self.get_processed_data(
-                country_config=mock_country_config,
-                number_coord=self.numbers,
-                include_step=True,
-                dis24=mock_ensemble_raw(single_day=single_day)[2],
-                single_day=single_day,
+                country_config=session_country_config
             )
-
-        return _mock_processed_data_forecast
-
-    def test_reanalysis_process(
-        self, mock_country_config, mock_processed_data_reanalysis
-    ):
-        """Test GloFAS reanalysis process method."""
-        glofas_reanalysis = GlofasReanalysis(
-            country_config=mock_country_config,
-            geo_bounding_box=self.geo_bounding_box,
-            start_date=date(year=2021, month=1, day=1),
-            end_date=date(year=2021, month=12, day=31),
+        single_day = request.param == "forecast"
+        cf_raw, pf_raw, expected_dis24 = mock_ensemble_raw(
+            single_day=single_day
         )
-        output_filepath = glofas_reanalysis.process()[0]
-        # use open_dataset since load_dataset is patched
-        with xr.open_dataset(output_filepath) as output_ds:
-            assert output_ds.equals(mock_processed_data_reanalysis)
-
-    def test_reforecast_process(
-        self, mock_country_config, mock_processed_data_forecast
-    ):
-        """Test GloFAS reforecast process method."""
-        target_dataset = mock_processed_data_forecast()
-        glofas_reforecast = GlofasReforecast(
-            country_config=mock_country_config,
-            geo_bounding_box=self.geo_bounding_box,
-            leadtime_max=3,
-            start_date=date(year=2018, month=3, day=1),
-            end_date=date(year=2018, month=3, day=31),
+        mocker.patch(
+            "ochanticipy.datasources.glofas.forecast.xr.load_dataset",
+            side_effect=[cf_raw, pf_raw],
+        )
+        return self.get_processed_data(
+            country_config=session_country_config,
+            number_coord=self.numbers,
+            include_step=True,
+            dis24=expected_dis24,
+            single_day=single_day,
         )
-        output_filepath = glofas_reforecast.process()[0]
-        with xr.open_dataset(output_filepath) as output_ds:
-            assert output_ds.equals(target_dataset)
 
-    def test_forecast_process(
+    @pytest.fixture()
+    def mock_to_netcdf(self, mocker):
+        """Keep the processed datasets in memory instead of writing them."""
+        return mocker.patch.object(xr.Dataset, "to_netcdf", autospec=True)
+
+    @pytest.mark.parametrize(
+        "mock_processed_data, glofas_class, kwargs",
+        [
+            pytest.param(
+                "reanalysis",
+                GlofasReanalysis,
+                {
+                    "start_date": date(year=2021, month=1, day=1),
+                    "end_date": date(year=2021, month=12, day=31),
+                },
+                id="reanalysis",
+            ),
+            pytest.param(
+                "reforecast",
+                GlofasReforecast,
+                {
+                    "leadtime_max": 3,
+                    "start_date": date(year=2018, month=3, day=1),
+                    "end_date": date(year=2018, month=3, day=31),
+                },
+                id="reforecast",
+            ),
+            pytest.param(
+                "forecast",
+                GlofasForecast,
+                {
+                    "leadtime_max": 3,
+                    "start_date": date(year=2022, month=1, day=1),
+                    "end_date": date(year=2022, month=1, day=1),
+                },
+                id="forecast",
+            ),
+        ],
+        indirect=["mock_processed_data"],
+    )
+    def test_process(
         self,
-        mock_country_config,
-        mock_processed_data_forecast,
-        mock_ensemble_raw,
+        session_country_config,
+        mock_processed_data,
+        mock_to_netcdf,
+        glofas_class,
+        kwargs,
     ):
-        """Test GloFAS forecast process method."""
-        target_dataset = mock_processed_data_forecast(single_day=True)
-        glofas_forecast = GlofasForecast(
-            country_config=mock_country_config,
+        """Test GloFAS process method."""
+        glofas = glofas_class(
+            country_config=session_country_config,
             geo_bounding_box=self.geo_bounding_box,
-            leadtime_max=3,
-            start_date=date(year=2022, month=1, day=1),
-            end_date=date(year=2022, month=1, day=1),
+            **kwargs,
         )
-        output_filepath = glofas_forecast.process()[0]
-        with xr.open_dataset(output_filepath) as output_ds:
-            assert output_ds.equals(target_dataset)
+        output_filepath = glofas.process()[0]
+        # the dataset that would have been written, kept in memory
+        output_ds, filepath = mock_to_netcdf.call_args[0]
+        assert filepath == output_filepath
+        xr.testing.assert_identical(output_ds, mock_processed_data)
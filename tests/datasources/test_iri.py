@@ -1,34 +1,47 @@
 """Tests for the IRI module."""
+from pathlib import PurePosixPath
+
 import cftime
 import numpy as np
 import pytest
 import requests
 import xarray as xr
+from conftest import ISO3
 from xarray.coding.cftimeindex import CFTimeIndex
 
-from ochanticipy import GeoBoundingBox, IriForecastDominant, IriForecastProb
+from ochanticipy import IriForecastDominant, IriForecastProb
+from ochanticipy.datasources.iri import iri_seasonal_forecast as iri_module
 
 DATASOURCE_BASE_DIR = "iri"
 FAKE_IRI_AUTH = "FAKE_IRI_AUTH"
 
+PROCESSED_PROB_FILEPATH = PurePosixPath(
+    f"private/processed/{ISO3}/{DATASOURCE_BASE_DIR}/{ISO3}_"
+    "iri_forecast_seasonal_precipitation_tercile_prob_Np6Sp3Ep2Wm3.nc"
+)
+
+EXPECTED_F_INDEX = CFTimeIndex(
+    [
+        cftime.datetime(year=2017, month=2, day=16, calendar="360_day"),
+        cftime.datetime(year=2017, month=3, day=16, calendar="360_day"),
+    ]
+)
+
 
 @pytest.fixture
-def mock_iri(mock_country_config):
+def mock_iri(session_country_config, iridl_geo_bounding_box):
     """Create IRI class with mock country config."""
-    geo_bounding_box = GeoBoundingBox(
-        lat_max=6, lat_min=3.2, lon_max=2, lon_min=-3
-    )
 
     def _mock_iri(prob_forecast: bool = True):
         if prob_forecast:
             iri = IriForecastProb(
-                country_config=mock_country_config,
-                geo_bounding_box=geo_bounding_box,
+                country_config=session_country_config,
+                geo_bounding_box=iridl_geo_bounding_box,
             )
         else:
             iri = IriForecastDominant(
-                country_config=mock_country_config,
-                geo_bounding_box=geo_bounding_box,
+                country_config=session_country_config,
+                geo_bounding_box=iridl_geo_bounding_box,
             )
         return iri
 
@@ -36,24 +49,15 @@ def mock_iri(mock_country_config):
 
 
 @pytest.fixture
-def mock_download(mocker, mock_iri):
+def mock_download(mocker, monkeypatch, mock_iri):
     """
     Call download with mocked _download.
 
     `forecast_type` is the type of forecast to
     test, can be either 'prob' or 'dominant'.
     """
-    download_mock = mocker.patch(
-        (
-            "ochanticipy.datasources.iri.iri_seasonal_forecast"
-            "._IriForecast._download"
-        )
-    )
-
-    mocker.patch.dict(
-        "ochanticipy.datasources.iri.iri_seasonal_forecast.os.environ",
-        {"IRI_AUTH": FAKE_IRI_AUTH},
-    )
+    download_mock = mocker.patch.object(iri_module._IriForecast, "_download")
+    monkeypatch.setenv("IRI_AUTH", FAKE_IRI_AUTH)
 
     def _mock_download(prob_forecast: bool):
         iri = mock_iri(prob_forecast=prob_forecast)
@@ -66,73 +70,53 @@ def mock_download(mocker, mock_iri):
     return _mock_download
 
 
-def test_download_call_prob(
-    mock_download, mock_aa_data_dir, mock_country_config
-):
-    """Test download for tercile probability forecast."""
-    url, filepath = mock_download(prob_forecast=True)
-    assert url == (
-        "https://iridl.ldeo.columbia.edu/SOURCES/.IRI/.FD/"
-        ".NMME_Seasonal_Forecast/"
-        ".Precipitation_ELR/.prob/X/%28-3.0%29%282.0%29RANGEEDGES/"
-        "Y/%286.0%29%283.0%29RANGEEDGES/data.nc"
-    )
-
-    assert filepath == (
-        mock_aa_data_dir
-        / f"private/raw/{mock_country_config.iso3}/{DATASOURCE_BASE_DIR}/"
-        f"abc_iri_forecast_seasonal_precipitation_"
-        f"tercile_prob_Np6Sp3Ep2Wm3.nc"
-    )
-
-
-def test_download_call_dominant(
-    mock_download, mock_aa_data_dir, mock_country_config
+@pytest.mark.parametrize(
+    "prob_forecast, forecast_type",
+    [(True, "prob"), (False, "dominant")],
+)
+def test_download_call(
+    mock_download,
+    mock_aa_data_dir,
+    prob_forecast,
+    forecast_type,
 ):
-    """Test download for dominant tercile forecast."""
-    url, filepath = mock_download(prob_forecast=False)
+    """Test download for tercile probability and dominant forecasts."""
+    url, filepath = mock_download(prob_forecast=prob_forecast)
     assert url == (
         "https://iridl.ldeo.columbia.edu/SOURCES/.IRI/.FD/"
         ".NMME_Seasonal_Forecast/"
-        ".Precipitation_ELR/.dominant/X/%28-3.0%29%282.0%29RANGEEDGES/"
+        f".Precipitation_ELR/.{forecast_type}/X/%28-3.0%29%282.0%29RANGEEDGES/"
         "Y/%286.0%29%283.0%29RANGEEDGES/data.nc"
     )
 
     assert filepath == (
-        mock_aa_data_dir
-        / f"private/raw/{mock_country_config.iso3}/{DATASOURCE_BASE_DIR}/"
-        f"abc_iri_forecast_seasonal_"
-        f"precipitation_tercile_dominant_Np6Sp3Ep2Wm3.nc"
+        mock_aa_data_dir / f"private/raw/{ISO3}/{DATASOURCE_BASE_DIR}/"
+        f"{ISO3}_iri_forecast_seasonal_precipitation_"
+        f"tercile_{forecast_type}_Np6Sp3Ep2Wm3.nc"
     )
 
 
 @pytest.fixture
-def mock_requests(mocker):
+def mock_requests(mocker, monkeypatch):
     """Mock requests in the download function."""
-    requests_mock = mocker.patch(
-        "ochanticipy.datasources.iri.iri_seasonal_forecast.requests.get"
-    )
-    mocker.patch.dict(
-        "ochanticipy.datasources.iri.iri_seasonal_forecast.os.environ",
-        {"IRI_AUTH": FAKE_IRI_AUTH},
-    )
+    requests_mock = mocker.patch.object(iri_module.requests, "get")
+    monkeypatch.setenv("IRI_AUTH", FAKE_IRI_AUTH)
 
     return requests_mock
 
 
-def test_download_wrong_auth(
-    mock_iri, mock_requests, mock_aa_data_dir, mock_country_config
-):
+def test_download_wrong_auth(mock_iri, mock_requests, mock_aa_data_dir):
     """Check that wrong download headers raise an error."""
     iri = mock_iri(prob_forecast=True)
     with pytest.raises(requests.RequestException):
         iri.download()
 
 
-def test_process(mocker, mock_iri, mock_aa_data_dir, mock_country_config):
-    """Test process for IRI forecast."""
+@pytest.fixture(scope="module")
+def fake_raw_iri_dataset():
+    """Create raw IRI forecast dataset as downloaded."""
     ds = xr.DataArray(
-        np.reshape(a=np.arange(16), newshape=(2, 2, 2, 2)),
+        np.arange(16).reshape(2, 2, 2, 2),
         dims=("L", "X", "Y", "F"),
         coords={
             "L": [1, 2],
@@ -144,38 +128,41 @@ def test_process(mocker, mock_iri, mock_aa_data_dir, mock_country_config):
 
     ds["F"].attrs["calendar"] = "360"
     ds["F"].attrs["units"] = "months since 1960-01-01"
+    return ds
+
+
+def test_process(
+    mocker,
+    mock_iri,
+    mock_aa_data_dir,
+    fake_raw_iri_dataset,
+):
+    """Test process for IRI forecast."""
+    # processing corrects the calendar in place, so pass a shallow copy
+    # that has its own attributes but shares the data
+    ds = fake_raw_iri_dataset.copy(deep=False)
 
     iri = mock_iri()
 
     # TODO: now created `load_raw` to be able to mock but would like
     #  to do it from xr.load_dataset directly
-    mocker.patch(
-        "ochanticipy.datasources.iri.iri_seasonal_forecast."
-        "_IriForecast._load_raw",
-        return_value=ds,
+    mocker.patch.object(iri_module._IriForecast, "_load_raw", return_value=ds)
+
+    mock_to_netcdf = mocker.patch.object(
+        xr.Dataset, "to_netcdf", autospec=True
     )
 
     processed_path = iri.process()
-    assert processed_path == (
-        mock_aa_data_dir / f"private/processed/{mock_country_config.iso3}/"
-        f"{DATASOURCE_BASE_DIR}/{mock_country_config.iso3}_"
-        f"iri_forecast_seasonal_precipitation_"
-        f"tercile_prob_Np6Sp3Ep2Wm3.nc"
-    )
+    assert processed_path == mock_aa_data_dir / PROCESSED_PROB_FILEPATH
 
-    da_processed = xr.load_dataset(processed_path)
-    expected_f = CFTimeIndex(
-        [
-            cftime.datetime(year=2017, month=2, day=16, calendar="360_day"),
-            cftime.datetime(year=2017, month=3, day=16, calendar="360_day"),
-        ]
+    # the dataset that would have been written, kept in memory
+    da_processed, output_filepath = mock_to_netcdf.call_args[0]
+    assert output_filepath == processed_path
+    # processing only decodes the forecast dates
+    xr.testing.assert_equal(
+        da_processed, fake_raw_iri_dataset.assign_coords(F=EXPECTED_F_INDEX)
     )
 
-    assert np.array_equal(da_processed.X.values, [2, -3])
-    assert np.array_equal(da_processed.Y.values, [97, 90])
-    assert da_processed.get_index("F").equals(expected_f)
-    assert np.array_equal(da_processed.prob.values, ds.prob.values)
-
 
 def test_process_if_download_not_called(mock_iri):
     """Test that correct error message raised."""
@@ -194,9 +181,7 @@ def test_process_if_download_not_called(mock_iri):
 @pytest.fixture
 def mock_xr_load_dataset(mocker):
     """Mock GeoPandas file reading function."""
-    return mocker.patch(
-        "ochanticipy.datasources.iri.iri_seasonal_forecast.xr.load_dataset"
-    )
+    return mocker.patch.object(iri_module.xr, "load_dataset")
 
 
 def test_iri_load(
@@ -204,28 +189,14 @@ def test_iri_load(
     mock_xr_load_dataset,
     mock_iri,
     mock_aa_data_dir,
-    mock_country_config,
 ):
     """Test that load_codab calls the HDX API to download."""
-    mocker.patch(
-        (
-            "ochanticipy.datasources.iri.iri_seasonal_forecast"
-            "._IriForecast._download"
-        )
-    )
+    mocker.patch.object(iri_module._IriForecast, "_download")
 
     iri = mock_iri()
     iri.load()
-    mock_xr_load_dataset.assert_has_calls(
-        [
-            mocker.call(
-                mock_aa_data_dir
-                / f"private/processed/{mock_country_config.iso3}/"
-                f"{DATASOURCE_BASE_DIR}/{mock_country_config.iso3}"
-                f"_iri_forecast_seasonal_precipitation_"
-                f"tercile_prob_Np6Sp3Ep2Wm3.nc"
-            ),
-        ]
+    mock_xr_load_dataset.assert_called_once_with(
+        mock_aa_data_dir / PROCESSED_PROB_FILEPATH
     )
 
 
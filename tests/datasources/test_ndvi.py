@@ -1,5 +1,4 @@
 """Tests for the USGS NDVI module."""
-import tempfile
 from datetime import date, datetime, timedelta
 from pathlib import Path
 
@@ -16,12 +15,13 @@ from ochanticipy import (
     UsgsNdviSmoothed,
     UsgsNdviYearDifference,
 )
+from ochanticipy.datasources.usgs import ndvi_base
 
 DATASOURCE_BASE_DIR = "usgs_ndvi"
 
 
 @pytest.fixture
-def mock_ndvi(mock_country_config):
+def mock_ndvi(session_country_config):
     """Create USGS NDVI class with mock country config."""
     start_date = (2019, 36)
     end_date = (2020, 2)
@@ -35,7 +35,7 @@ def mock_ndvi(mock_country_config):
 
     def _mock_ndvi(variable: str = "smoothed"):
         ndvi = instantiator[variable](
-            country_config=mock_country_config,
+            country_config=session_country_config,
             start_date=start_date,
             end_date=end_date,
         )
@@ -52,11 +52,8 @@ def mock_download(mocker, mock_ndvi):
     Return number of calls to the internal
     download method and the returned filepath.
     """
-    download_mock = mocker.patch(
-        (
-            "ochanticipy.datasources.usgs."
-            "ndvi_base._UsgsNdvi._download_ndvi_dekad"
-        )
+    download_mock = mocker.patch.object(
+        ndvi_base._UsgsNdvi, "_download_ndvi_dekad"
     )
 
     def _mock_download(variable: str = "smoothed"):
@@ -69,15 +66,16 @@ def mock_download(mocker, mock_ndvi):
 
 
 @pytest.fixture
-def mock_determine_process_dates(mocker, mock_ndvi):
+def mock_determine_process_dates(mocker, tmp_path, mock_ndvi):
     """
     Call _determine_process_dates() with mocked _load().
 
     Return number of calls to the internal
     download method and the returned filepath.
     """
-    mocker.patch(
-        ("ochanticipy.datasources.usgs.ndvi_base._UsgsNdvi._load"),
+    mocker.patch.object(
+        ndvi_base._UsgsNdvi,
+        "_load",
         return_value=pd.DataFrame(
             {
                 "year": [2019, 2020, 2020],
@@ -87,9 +85,10 @@ def mock_determine_process_dates(mocker, mock_ndvi):
         ),
     )
 
-    mocker.patch(
-        "ochanticipy.datasources.usgs.ndvi_base._UsgsNdvi._get_raw_path",
-        return_value=Path(tempfile.mkstemp()[1]),
+    raw_path = tmp_path / "raw.tif"
+    raw_path.touch()
+    mocker.patch.object(
+        ndvi_base._UsgsNdvi, "_get_raw_path", return_value=raw_path
     )
 
     def _mock_determine_process_dates(clobber: bool, dates_to_process: list):
@@ -116,85 +115,83 @@ def gdf():
     return gpd.GeoDataFrame(d)
 
 
-@pytest.fixture
-def da():
-    """
-    Create raster input with date coordinate.
-
-    Used as side effect later to create 3
-    consecutive raster values for processing.
-    """
-
-    def _da(year_dekad):
-        da = xr.DataArray(
-            [[[1 + year_dekad[1], 2, 3], [4, 5 + year_dekad[1], 6]]],
-            dims=("band", "y", "x"),
-            coords={
-                "y": [1.5, 0.5],
-                "x": [0.5, 1.5, 2.5],
-            },
-        ).rio.write_crs("EPSG:4326")
-        return da
-
-    return _da
+def _fake_raster(year_dekad: tuple) -> xr.DataArray:
+    """Create raster input whose values depend on the dekad."""
+    return xr.DataArray(
+        [[[1 + year_dekad[1], 2, 3], [4, 5 + year_dekad[1], 6]]],
+        dims=("band", "y", "x"),
+        coords={
+            "y": [1.5, 0.5],
+            "x": [0.5, 1.5, 2.5],
+        },
+    ).rio.write_crs("EPSG:4326")
 
 
-def test_download_smoothed(mock_download, mock_aa_data_dir):
-    """Test download for all NDVI variables."""
-    fp, call_count = mock_download(variable="smoothed")
-
-    assert fp == (mock_aa_data_dir / f"public/raw/glb/{DATASOURCE_BASE_DIR}")
-    assert call_count == 3
-
-
-def test_download_pct_median(mock_download, mock_aa_data_dir):
-    """Test download for all NDVI variables."""
-    fp, call_count = mock_download(variable="pct_median")
-
-    assert fp == (mock_aa_data_dir / f"public/raw/glb/{DATASOURCE_BASE_DIR}")
-
-    assert call_count
-
-
-def test_download_anomaly(mock_download, mock_aa_data_dir):
-    """Test download for all NDVI variables."""
-    fp, call_count = mock_download(variable="anomaly")
-
-    assert fp == (mock_aa_data_dir / f"public/raw/glb/{DATASOURCE_BASE_DIR}")
+@pytest.fixture(scope="module")
+def fake_rasters():
+    """
+    Create raster input for 3 consecutive dekads.
 
-    assert call_count
+    Used as side effect later for processing. Processing doesn't modify
+    the rasters, so they are created once and shared.
+    """
+    return [
+        _fake_raster(year_dekad=year_dekad)
+        for year_dekad in [(2019, 36), (2020, 1), (2020, 2)]
+    ]
 
 
-def test_download_difference(mock_download, mock_aa_data_dir):
+@pytest.mark.parametrize(
+    "variable, expected_call_count",
+    [
+        ("smoothed", 3),
+        ("pct_median", None),
+        ("anomaly", None),
+        ("difference", None),
+    ],
+)
+def test_download(
+    mock_download, mock_aa_data_dir, variable, expected_call_count
+):
     """Test download for all NDVI variables."""
-    fp, call_count = mock_download(variable="difference")
+    fp, call_count = mock_download(variable=variable)
 
     assert fp == (mock_aa_data_dir / f"public/raw/glb/{DATASOURCE_BASE_DIR}")
-
-    assert call_count
+    if expected_call_count is None:
+        assert call_count
+    else:
+        assert call_count == expected_call_count
 
 
 def test_process_and_load(
-    mocker, mock_ndvi, mock_aa_data_dir, mock_country_config, gdf, da
+    mocker,
+    tmp_path,
+    mock_ndvi,
+    mock_aa_data_dir,
+    session_country_config,
+    gdf,
+    fake_rasters,
 ):
     """Test processing NDVI values."""
     ndvi = mock_ndvi(variable="smoothed")
 
     # TODO: now created `load_raw` to be able to mock but would like
     #  to do it from xr.load_dataset directly
-    mocker.patch(
-        "ochanticipy.datasources.usgs.ndvi_base.rioxarray.open_rasterio",
-        side_effect=[da((2019, 36)), da((2020, 1)), da((2020, 2))] * 6,
+    mocker.patch.object(
+        ndvi_base.rioxarray,
+        "open_rasterio",
+        side_effect=fake_rasters * 6,
     )
 
-    mocker.patch(
-        "ochanticipy.datasources.usgs.ndvi_base._UsgsNdvi._get_raw_path",
-        return_value=Path(tempfile.mkstemp()[1]),
+    raw_path = tmp_path / "raw.tif"
+    raw_path.touch()
+    mocker.patch.object(
+        ndvi_base._UsgsNdvi, "_get_raw_path", return_value=raw_path
     )
 
     processed_dir = ndvi.process(gdf=gdf, feature_col="name")
     assert processed_dir == (
-        mock_aa_data_dir / f"public/processed/{mock_country_config.iso3}/"
+        mock_aa_data_dir / f"public/processed/{session_country_config.iso3}/"
         f"{DATASOURCE_BASE_DIR}"
     )
 
@@ -132,6 +132,30 @@ def test_compute_raster_stats_2d(da_2d, gdf, expected_2d):
     assert_frame_equal(result_pct, expected_2d, check_dtype=False)
 
 
+def test_compute_raster_stats_2d_dtypes(da_2d, gdf):
+    """Stats columns for 2d raster keep the dtype of each statistic."""
+    result = da_2d.oap.compute_raster_stats(gdf, "name")
+    assert result.dtypes.to_dict() == {
+        "mean": np.float64,
+        "std": np.float64,
+        "min": np.int64,
+        "max": np.int64,
+        "sum": np.float64,
+        "count": np.int64,
+        "name": object,
+    }
+
+
+def test_compute_raster_stats_percentiles(da_2d, gdf, expected_2d):
+    """Compute multiple percentiles in a single call."""
+    expected_2d.insert(loc=6, column="5quant", value=[1.15, 3.15])
+    expected_2d.insert(loc=7, column="95quant", value=[4.85, 5.85])
+    result = da_2d.oap.compute_raster_stats(
+        gdf=gdf, feature_col="name", percentile_list=[5, 95]
+    )
+    assert_frame_equal(result, expected_2d, check_dtype=False)
+
+
 def test_compute_raster_stats_3d(ds_3d, gdf, expected_3d):
     """Compute raster stats with time dimensions."""
     result = ds_3d.oap.compute_raster_stats(
@@ -148,6 +172,25 @@ def test_compute_raster_stats_3d(ds_3d, gdf, expected_3d):
     assert_frame_equal(result_str[0], expected_3d, check_dtype=False)
 
 
+def test_compute_raster_stats_dask(da_3d, gdf, expected_3d):
+    """Compute raster stats lazily on dask-backed array."""
+    result = da_3d.chunk().oap.compute_raster_stats(
+        gdf=gdf, feature_col="name"
+    )
+    assert_frame_equal(result, expected_3d, check_dtype=False)
+    result_no_dask = da_3d.chunk().oap.compute_raster_stats(
+        gdf=gdf, feature_col="name", use_dask=False
+    )
+    assert_frame_equal(result_no_dask, expected_3d, check_dtype=False)
+
+
+def test_compute_raster_stats_set_crs(da_3d, gdf, expected_3d):
+    """Compute raster stats when the CRS is set but not written."""
+    da_set_crs = da_3d.drop_vars("spatial_ref").rio.set_crs("EPSG:4326")
+    result = da_set_crs.oap.compute_raster_stats(gdf=gdf, feature_col="name")
+    assert_frame_equal(result, expected_3d, check_dtype=False)
+
+
 def test_compute_raster_stats_da_assertions(da_3d, gdf):
     """Ensure error assertions working in compute raster stats."""
     with pytest.raises(MissingCRS):
@@ -169,6 +212,14 @@ def test_correct_calendar_change(da_3d, caplog):
     assert "Calendar attribute changed from '360' to '360_day'." in caplog.text
 
 
+def test_correct_calendar_copy(da_3d):
+    """Ensure calendar correction does not modify original array."""
+    da_3d[da_3d.oap.t_dim].attrs["calendar"] = "360"
+    da_crct = da_3d.oap.correct_calendar()
+    assert da_crct[da_crct.oap.t_dim].attrs["calendar"] == "360_day"
+    assert da_3d[da_3d.oap.t_dim].attrs["calendar"] == "360"
+
+
 def test_correct_calendar_add(da_3d, caplog):
     """Ensure calendar logs change from units to 360_day."""
     caplog.set_level(logging.INFO)